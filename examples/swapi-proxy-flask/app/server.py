@@ -1,11 +1,16 @@
 # -*- coding: utf-8 -*-
 
+import collections
+import hashlib
 import os
+import threading
 
 import flask
+import orjson
 
-from py_gql import process_graphql_query
+from py_gql import compile_query
 from py_gql.execution.runtime import ThreadPoolRuntime
+from py_gql.lang import ast as _ast
 from py_gql.schema.transforms import CamelCaseSchemaTransform, transform_schema
 from py_gql.tracers import ApolloTracer
 
@@ -20,13 +25,75 @@ with open(os.path.join(os.path.dirname(__file__), "graphiql.html")) as f:
 
 app = flask.Flask(__name__)
 
-# Let the initial order be respected.
-app.config["JSON_SORT_KEYS"] = False
 
 CAMEL_CASED_SCHEMA = transform_schema(SCHEMA, CamelCaseSchemaTransform())
 SCHEMA_SDL = CAMEL_CASED_SCHEMA.to_string()
 
 
+# Parsed and validated queries keyed by the SHA-256 digest of their source
+# text. This also supports Apollo's automatic persisted queries where clients
+# send the hash alone once the server knows about the query.
+QUERY_CACHE_SIZE = 256
+QUERY_CACHE = collections.OrderedDict()
+QUERY_CACHE_LOCK = threading.Lock()
+
+# Introspection only depends on the schema, so the serialized response of
+# introspection queries without variables can be reused for as long as the
+# compiled query is cached.
+INTROSPECTION_FIELDS = frozenset(("__schema", "__type", "__typename"))
+INTROSPECTION_RESPONSES = {}
+
+
+def compiled_query(query_hash, query, operation_name):
+    key = query_hash, operation_name
+    with QUERY_CACHE_LOCK:
+        try:
+            QUERY_CACHE.move_to_end(key)
+            return QUERY_CACHE[key]
+        except KeyError:
+            if query is None:
+                return None
+
+    compiled = compile_query(
+        CAMEL_CASED_SCHEMA, query, operation_name=operation_name
+    )
+
+    with QUERY_CACHE_LOCK:
+        QUERY_CACHE[key] = compiled
+        if len(QUERY_CACHE) > QUERY_CACHE_SIZE:
+            evicted, _ = QUERY_CACHE.popitem(last=False)
+            INTROSPECTION_RESPONSES.pop(evicted, None)
+
+    return compiled
+
+
+def is_introspection_query(compiled):
+    operation = compiled.operation
+    return (
+        not compiled.errors
+        and operation is not None
+        and operation.operation == "query"
+        and not operation.variable_definitions
+        and all(
+            isinstance(selection, _ast.Field)
+            and selection.name.value in INTROSPECTION_FIELDS
+            for selection in operation.selection_set.selections
+        )
+    )
+
+
+def json_response(body):
+    # orjson is much faster than flask.jsonify for large responses and
+    # preserves key order.
+    if not isinstance(body, bytes):
+        body = orjson.dumps(body)
+    return flask.Response(body, mimetype="application/json")
+
+
+def _error(message):
+    return json_response({"errors": [{"message": message}]})
+
+
 @app.route("/sdl")
 def sdl_route():
     return flask.Response(SCHEMA_SDL, mimetype="text")
@@ -37,20 +104,52 @@ def graphql_route():
 
     data = flask.request.json
 
+    query = data.get("query")
+    persisted = (data.get("extensions") or {}).get("persistedQuery")
+
+    if persisted is not None:
+        query_hash = persisted.get("sha256Hash")
+        if query is not None and (
+            query_hash != hashlib.sha256(query.encode("utf8")).hexdigest()
+        ):
+            return _error("provided sha does not match query")
+    elif query is not None:
+        query_hash = hashlib.sha256(query.encode("utf8")).hexdigest()
+    else:
+        return _error("Must provide query string.")
+
+    compiled = compiled_query(query_hash, query, data.get("operation_name"))
+    if compiled is None:
+        return _error("PersistedQueryNotFound")
+
+    if is_introspection_query(compiled):
+        key = query_hash, data.get("operation_name")
+        with QUERY_CACHE_LOCK:
+            body = INTROSPECTION_RESPONSES.get(key)
+        if body is None:
+            result = compiled.execute(runtime=RUNTIME).result()
+            body = orjson.dumps(result.response())
+            with QUERY_CACHE_LOCK:
+                # Responses are dropped alongside their compiled query, don't
+                # store one if it has been evicted in the meantime.
+                if key in QUERY_CACHE:
+                    INTROSPECTION_RESPONSES[key] = body
+        return json_response(body)
+
     tracer = ApolloTracer()
 
-    result = process_graphql_query(
-        CAMEL_CASED_SCHEMA,
-        data["query"],
-        variables=data.get("variables", {}),
-        operation_name=data.get("operation_name"),
-        instrumentation=tracer,
-        runtime=RUNTIME,
-    ).result()
+    result = (
+        compiled.execute(
+            variables=data.get("variables", {}),
+            instrumentation=tracer,
+            runtime=RUNTIME,
+        )
+        .result()
+    )
 
     result.add_extension(tracer)
 
-    return flask.jsonify(result.response())
+    return json_response(result.response())
 
 
 @app.route("/graphiql")
@@ -13,7 +13,13 @@ you implement custom behaviors and runtimes.
 from ._pkg import __version__  # isort:skip
 
 from . import lang, schema, tracers, utilities  # noqa: F401
-from ._graphql import graphql, graphql_blocking, process_graphql_query
+from ._graphql import (
+    CompiledQuery,
+    compile_query,
+    graphql,
+    graphql_blocking,
+    process_graphql_query,
+)
 from .execution import GraphQLResult, ResolveInfo
 from .sdl import build_schema
 
@@ -23,6 +29,8 @@ __all__ = (
     "graphql",
     "graphql_blocking",
     "process_graphql_query",
+    "compile_query",
+    "CompiledQuery",
     "GraphQLResult",
     "ResolveInfo",
     "build_schema",
@@ -1,8 +1,24 @@
 # -*- coding: utf-8 -*-
 
-from typing import Any, Callable, Mapping, Optional, Sequence, Type, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+    cast,
+)
 
-from .exc import ExecutionError, GraphQLSyntaxError, VariablesCoercionError
+from .exc import (
+    ExecutionError,
+    GraphQLResponseError,
+    GraphQLSyntaxError,
+    VariablesCoercionError,
+)
 from .execution import (
     BlockingExecutor,
     Executor,
@@ -10,10 +26,14 @@ from .execution import (
     Instrumentation,
     execute,
 )
+from .execution.execute import _execute_operation
+from .execution.get_operation import get_operation_with_type
 from .execution.runtime import AsyncIORuntime, BlockingRuntime, Runtime
+from .execution.wrappers import GroupedFields
 from .lang import parse
-from .lang.ast import Document
-from .schema import Schema
+from .lang import ast as _ast
+from .lang.ast import Document, OperationDefinition
+from .schema import ObjectType, Schema
 from .validation import Validator, validate_ast
 
 
@@ -64,7 +84,9 @@ def process_graphql_query(
         middlewares: List of middleware functions.
             Middlewares are used to wrap the resolution of **all** fields with
             common logic, they are good candidates for logging, authentication,
-            and execution guards.
+            and execution guards. Use
+            :func:`~py_gql.execution.field_middleware` to restrict a
+            middleware to specific fields.
         instrumentation: Instrumentation instance.
             Use :class:`~py_gql.execution.MultiInstrumentation` to compose
             multiple instances together.
@@ -216,3 +238,226 @@ def graphql_blocking(
             executor_cls=BlockingExecutor,
         ),
     )
+
+
+class CompiledQuery:
+    """
+    GraphQL operation prepared for repeated execution.
+
+    Compiling a query runs parsing, validation and operation resolution once
+    so that executing the same document multiple times (e.g. for frequent or
+    persisted queries) only pays for variable coercion and field resolution.
+
+    Field collection (which includes resolving fragments) only depends on the
+    request through ``@skip`` and ``@include`` directives using variables. When
+    the document doesn't contain any, collected fields are shared across
+    executions as well.
+
+    Instances should be created through :func:`compile_query`.
+    """
+
+    __slots__ = (
+        "schema",
+        "document",
+        "operation",
+        "root_type",
+        "errors",
+        "_has_data",
+        "_grouped_fields",
+    )
+
+    def __init__(
+        self,
+        schema: Schema,
+        document: Optional[Document],
+        operation: Optional[OperationDefinition] = None,
+        root_type: Optional[ObjectType] = None,
+        errors: Optional[Sequence[GraphQLResponseError]] = None,
+        has_data: bool = False,
+    ):
+        #: ~py_gql.schema.Schema: Schema the query was compiled against.
+        self.schema = schema
+        #: Optional[~py_gql.lang.ast.Document]: Parsed document.
+        self.document = document
+        #: Optional[~py_gql.lang.ast.OperationDefinition]: Operation to execute.
+        self.operation = operation
+        #: Optional[~py_gql.schema.ObjectType]: Root type of the operation.
+        self.root_type = root_type
+        #: List[~py_gql.exc.GraphQLResponseError]: Compilation errors.
+        self.errors = list(errors) if errors else []
+
+        self._has_data = has_data
+        self._grouped_fields = (
+            {}
+            if (
+                document is not None
+                and operation is not None
+                and not _has_variable_conditions(document)
+            )
+            else None
+        )  # type: Optional[Dict[Any, GroupedFields]]
+
+    def __bool__(self) -> bool:
+        return not self.errors
+
+    def execute(
+        self,
+        *,
+        variables: Optional[Mapping[str, Any]] = None,
+        root: Any = None,
+        context: Any = None,
+        middlewares: Optional[Sequence[Callable[..., Any]]] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        disable_introspection: bool = False,
+        runtime: Optional[Runtime] = None,
+        executor_cls: Type[Executor] = Executor
+    ) -> Any:
+        """
+        Execute the compiled query.
+
+        Arguments are the same as :func:`process_graphql_query` and so is the
+        returned value. If compilation failed, this returns the compilation
+        errors wrapped in the runtime's container type.
+
+        Note:
+            Parsing and validation happen in :func:`compile_query`, so the
+            ``instrumentation`` passed here does not receive the parsing and
+            validation hooks. Pass it to :func:`compile_query` as well to
+            trace these phases.
+        """
+        instrumentation = instrumentation or Instrumentation()
+        runtime = runtime or BlockingRuntime()
+
+        instrumentation.on_query_start()
+
+        def _abort(*args, **kwargs):
+            return runtime.ensure_wrapped(
+                _on_end(GraphQLResult(*args, **kwargs))
+            )
+
+        def _on_end(result: GraphQLResult) -> GraphQLResult:
+            instrumentation.on_query_end()
+            return result
+
+        if self.errors:
+            if self._has_data:
+                return _abort(data=None, errors=self.errors)
+            return _abort(errors=self.errors)
+
+        try:
+            return runtime.map_value(
+                _execute_operation(
+                    self.schema,
+                    cast(Document, self.document),
+                    cast(OperationDefinition, self.operation),
+                    cast(ObjectType, self.root_type),
+                    variables=variables,
+                    initial_value=root,
+                    context_value=context,
+                    instrumentation=instrumentation,
+                    middlewares=middlewares,
+                    disable_introspection=disable_introspection,
+                    executor_cls=executor_cls,
+                    runtime=runtime,
+                    grouped_fields=self._grouped_fields,
+                ),
+                _on_end,
+            )
+        except VariablesCoercionError as err:
+            return _abort(data=None, errors=err.errors)
+        except ExecutionError as err:
+            return _abort(data=None, errors=[err])
+
+
+def _has_variable_conditions(document: Document) -> bool:
+    # Whether any selection in the document is conditionally included based on
+    # variable values.
+    stack = [
+        definition.selection_set
+        for definition in document.definitions
+        if isinstance(
+            definition, (_ast.OperationDefinition, _ast.FragmentDefinition)
+        )
+    ]  # type: List[_ast.SelectionSet]
+
+    while stack:
+        for selection in stack.pop().selections:
+            directives = cast(_ast.SupportDirectives, selection).directives
+            for directive in directives:
+                if directive.name.value in ("skip", "include") and any(
+                    isinstance(arg.value, _ast.Variable)
+                    for arg in directive.arguments
+                ):
+                    return True
+
+            if (
+                isinstance(selection, (_ast.Field, _ast.InlineFragment))
+                and selection.selection_set is not None
+            ):
+                stack.append(selection.selection_set)
+
+    return False
+
+
+def compile_query(
+    schema: Schema,
+    document: Union[str, Document],
+    *,
+    operation_name: Optional[str] = None,
+    validators: Optional[Sequence[Validator]] = None,
+    instrumentation: Optional[Instrumentation] = None
+) -> CompiledQuery:
+    """
+    Parse, validate and prepare a GraphQL query for repeated execution.
+
+    Errors are not raised but collected on the returned
+    :class:`CompiledQuery` and reported when executing it, so the result can
+    be cached regardless of the document being valid.
+
+    Args:
+        schema: Schema to execute the query against.
+        document: The query document.
+        operation_name: Operation to execute
+            If specified, the operation with the given name will be executed.
+            If not, this executes the single operation without disambiguation.
+        validators: Custom validators.
+            Setting this will replace the defaults so if you just want to add
+            some rules, append to :obj:`py_gql.validation.SPECIFIED_RULES`.
+        instrumentation: Instrumentation instance.
+            Only the parsing and validation hooks are called during
+            compilation, the other hooks are called by
+            :meth:`CompiledQuery.execute`.
+
+    Returns:
+        Compiled query.
+    """
+    schema.validate()
+
+    instrumentation = instrumentation or Instrumentation()
+
+    if isinstance(document, str):
+        instrumentation.on_parsing_start()
+        try:
+            ast = parse(document)
+        except GraphQLSyntaxError as err:
+            return CompiledQuery(schema, None, errors=[err])
+        finally:
+            instrumentation.on_parsing_end()
+    else:
+        ast = document
+
+    instrumentation.on_validation_start()
+    validation_result = validate_ast(schema, ast, validators=validators)
+    instrumentation.on_validation_end()
+
+    if not validation_result:
+        return CompiledQuery(schema, ast, errors=validation_result.errors)
+
+    try:
+        operation, root_type = get_operation_with_type(
+            schema, ast, operation_name
+        )
+    except ExecutionError as err:
+        return CompiledQuery(schema, ast, errors=[err], has_data=True)
+
+    return CompiledQuery(schema, ast, operation, root_type)
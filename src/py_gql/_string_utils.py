@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+import bisect
+import functools
 import re
 import sys
 import textwrap
@@ -17,7 +19,6 @@ from typing import (
 )
 
 
-LINE_SEPARATOR = re.compile(r"\r\n|[\n\r]")
 EXTRACT_UNDERSCORES_RE = re.compile(r"^(_*).*(?<!_)(_*)$")
 
 ResponsePath = Sequence[Union[int, str]]
@@ -29,6 +30,19 @@ def ensure_unicode(string: Union[str, bytes]) -> str:
     return string
 
 
+def leading_whitespace(string: str) -> int:
+    """
+    Count the leading whitespace (spaces and tabs) characters of a string.
+
+    >>> leading_whitespace("  \\tfoo ")
+    3
+
+    >>> leading_whitespace("foo")
+    0
+    """
+    return len(string) - len(string.lstrip(" \t"))
+
+
 def parse_block_string(raw_string: str) -> str:
     """
     Parse a block string.
@@ -51,28 +65,58 @@ def parse_block_string(raw_string: str) -> str:
     lines = raw_string.splitlines()
 
     common_indent = sys.maxsize
+    first, last = len(lines), -1
+
+    # Single pass to find the common indentation and the first and last
+    # non blank lines.
+    for i, line in enumerate(lines):
+        indent = leading_whitespace(line)
+        if indent < len(line):
+            if i < first:
+                first = i
+            last = i
+            if i and indent < common_indent:
+                common_indent = indent
+
+    if common_indent == sys.maxsize:
+        common_indent = 0
+
+    return "\n".join(
+        line[common_indent:] if i else line
+        for i, line in enumerate(lines[first : last + 1], first)
+    )
 
-    for line in lines[1:]:
-        inner_len = len(line.lstrip())
-        if inner_len:
-            common_indent = min(common_indent, len(line) - inner_len)
 
-    if common_indent < sys.maxsize:
-        for i, line in enumerate(lines[1:]):
-            lines[i + 1] = line[common_indent:]
+# Kept for compatibility (only used in tests)
+def dedent(raw_string: str) -> str:
+    return textwrap.dedent(raw_string).lstrip()
+
 
-    while lines and (not lines[0].lstrip()):
-        lines.pop(0)
+@functools.lru_cache(maxsize=32)
+def _line_offsets(body: str) -> List[int]:
+    """
+    Compute the offsets at which every line of a source string starts.
 
-    while lines and (not lines[-1].lstrip()):
-        lines.pop()
+    Results are cached as the same source is usually looked up multiple times
+    in a row, e.g. when locating every error of a response.
 
-    return "\n".join(lines)
+    >>> _line_offsets("ab\\ncd\\ne")
+    [0, 3, 6]
+    """
+    offsets = [0]
+    find = body.find
+    index = find("\n")
+    while index != -1:
+        offsets.append(index + 1)
+        index = find("\n", index + 1)
+    return offsets
 
 
-# Kept for compatibility (only used in tests)
-def dedent(raw_string: str) -> str:
-    return textwrap.dedent(raw_string).lstrip()
+def _source_line(body: str, offsets: Sequence[int], index: int) -> str:
+    start = offsets[index]
+    end = offsets[index + 1] - 1 if index + 1 < len(offsets) else len(body)
+    line = body[start:end]
+    return line[:-1] if line.endswith("\r") else line
 
 
 def index_to_loc(body: str, position: int) -> Tuple[int, int]:
@@ -113,16 +157,9 @@ def index_to_loc(body: str, position: int) -> Tuple[int, int]:
     if position > len(body) or position < 0:
         raise IndexError(position)
 
-    lines, cols = 0, 0
-    for offset, char in enumerate(body):
-        if offset == position:
-            return (lines + 1, cols + 1)
-        elif char == "\n":
-            lines += 1
-            cols = 0
-        else:
-            cols += 1
-    return (lines + 1, cols + 1)
+    offsets = _line_offsets(body)
+    line_index = bisect.bisect_right(offsets, position) - 1
+    return (line_index + 1, position - offsets[line_index] + 1)
 
 
 def loc_to_index(body: str, loc: Tuple[int, int]) -> int:
@@ -164,14 +201,11 @@ def loc_to_index(body: str, loc: Tuple[int, int]) -> int:
         return 0
 
     lineo, col = loc
-    lines = 0
-    for index, char in enumerate(body):
-        if lines == lineo - 1:
-            if len(body) >= index + col - 1:
-                return index + col - 1
-            break
-        if char == "\n":
-            lines += 1
+    offsets = _line_offsets(body)
+    if 0 < lineo <= len(offsets):
+        index = offsets[lineo - 1]
+        if index < len(body) and len(body) >= index + col - 1:
+            return index + col - 1
     raise IndexError("%s:%s" % (lineo, col))
 
 
@@ -190,33 +224,24 @@ def highlight_location(body: str, position: int, delta: int = 2) -> str:
     """
     line, col = index_to_loc(body, position)
     line_index = line - 1
-    lines = LINE_SEPARATOR.split(body)
+    # Re-use the line offsets computed by index_to_loc to only extract the
+    # lines we're going to display.
+    offsets = _line_offsets(body)
     min_line = max(0, line_index - delta)
-    max_line = min(line_index + delta, len(lines) - 1)
+    max_line = min(line_index + delta, len(offsets) - 1)
+    lines = {
+        i: _source_line(body, offsets, i) for i in range(min_line, max_line + 1)
+    }
     pad_len = len(str(max_line + 1))
 
-    def ws(len_):
-        return "".join((" " for _ in range(len_)))
-
-    def lineno(l):
-        m = l + 1
-        return " ".join(str(x) for x in range(pad_len - len(str(m)))) + str(m)
+    def format_line(index: int) -> str:
+        return "  %s:%s" % (str(index + 1).zfill(pad_len), lines[index])
 
     output = ["(%d:%d):" % (line, col)]
-    output.extend(
-        [
-            ws(2) + lineno(l) + ":" + lines[l]
-            for l in range(min_line, line_index)
-        ]
-    )
-    output.append(ws(2) + lineno(line_index) + ":" + lines[line_index])
-    output.append(ws(2) + ws(len(str(max_line + 1)) + col) + "^")
-    output.extend(
-        [
-            ws(2) + lineno(l) + ":" + lines[l]
-            for l in range(line_index + 1, max_line + 1)
-        ]
-    )
+    output.extend(format_line(i) for i in range(min_line, line_index))
+    output.append(format_line(line_index))
+    output.append(" " * (2 + pad_len + col) + "^")
+    output.extend(format_line(i) for i in range(line_index + 1, max_line + 1))
     return "\n".join(output) + "\n"
 
 
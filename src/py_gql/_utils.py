@@ -354,12 +354,28 @@ def apply_middlewares(
 
     >>> final(10)  # ((10 - 1) * 2) ^ 2
     324
+
+    >>> apply_middlewares(square, [None])
+    Traceback (most recent call last):
+        ...
+    TypeError: Middleware should be a callable
     """
-    tail = func
     for mw in middlewares:
         if not callable(mw):
             raise TypeError("Middleware should be a callable")
 
+    return chain_middlewares(func, middlewares)
+
+
+def chain_middlewares(
+    func: Callable[..., Any], middlewares: Iterable[Callable[..., Any]]
+) -> Callable[..., Any]:
+    """
+    Same as :func:`apply_middlewares` for middlewares which have already been
+    checked to be callable.
+    """
+    tail = func
+    for mw in middlewares:
         tail = functools.partial(mw, tail)
 
     return tail
@@ -6,6 +6,7 @@ from .execute import execute
 from .executor import Executor
 from .get_operation import get_operation
 from .instrumentation import Instrumentation, MultiInstrumentation
+from .middlewares import field_middleware
 from .subscribe import subscribe
 from .wrappers import GraphQLExtension, GraphQLResult, ResolveInfo, ResponsePath
 
@@ -23,4 +24,5 @@ __all__ = (
     "get_operation",
     "Instrumentation",
     "MultiInstrumentation",
+    "field_middleware",
 )
@@ -1,15 +1,24 @@
 # -*- coding: utf-8 -*-
 
-from typing import Any, Callable, Mapping, Optional, Sequence, Type, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Mapping,
+    Optional,
+    Sequence,
+    Type,
+    cast,
+)
 
 from ..lang import ast as _ast
-from ..schema import Schema
+from ..schema import ObjectType, Schema
 from ..utilities import coerce_variable_values
 from .executor import Executor
 from .get_operation import get_operation_with_type
 from .instrumentation import Instrumentation
 from .runtime import BlockingRuntime, Runtime
-from .wrappers import GraphQLResult
+from .wrappers import GraphQLResult, GroupedFields
 
 
 Resolver = Callable[..., Any]
@@ -52,7 +61,9 @@ def execute(
         middlewares: List of middleware functions.
             Middlewares are used to wrap the resolution of **all** fields with
             common logic, they are good candidates for logging, authentication,
-            and execution guards.
+            and execution guards. Use
+            :func:`~py_gql.execution.field_middleware` to restrict a
+            middleware to specific fields.
         instrumentation: Instrumentation instance.
             Use :class:`~py_gql.execution.MultiInstrumentation` to compose
             multiple instances together.
@@ -74,12 +85,48 @@ def execute(
     Raises:
         RuntimeError: on invalid operation.
     """
-    instrumentation = instrumentation or Instrumentation()
-    runtime = runtime or BlockingRuntime()
-
     operation, root_type = get_operation_with_type(
         schema, document, operation_name
     )
+
+    return _execute_operation(
+        schema,
+        document,
+        operation,
+        root_type,
+        variables=variables,
+        initial_value=initial_value,
+        context_value=context_value,
+        middlewares=middlewares,
+        instrumentation=instrumentation,
+        disable_introspection=disable_introspection,
+        runtime=runtime,
+        executor_cls=executor_cls,
+    )
+
+
+def _execute_operation(
+    schema: Schema,
+    document: _ast.Document,
+    operation: _ast.OperationDefinition,
+    root_type: ObjectType,
+    *,
+    variables: Optional[Mapping[str, Any]] = None,
+    initial_value: Optional[Any] = None,
+    context_value: Optional[Any] = None,
+    middlewares: Optional[Sequence[Callable[..., Any]]] = None,
+    instrumentation: Optional[Instrumentation] = None,
+    disable_introspection: bool = False,
+    runtime: Optional[Runtime] = None,
+    executor_cls: Type[Executor] = Executor,
+    grouped_fields: Optional[Dict[Any, GroupedFields]] = None
+) -> Any:
+    # Execute an already extracted operation. ``grouped_fields`` can be used
+    # to share the field collection cache across executions when it is known
+    # to not depend on variables.
+    instrumentation = instrumentation or Instrumentation()
+    runtime = runtime or BlockingRuntime()
+
     coerced_variables = coerce_variable_values(
         schema, operation, variables or {}
     )
@@ -95,6 +142,9 @@ def execute(
         runtime=runtime,
     )
 
+    if grouped_fields is not None:
+        executor._grouped_fields = grouped_fields
+
     if operation.operation == "query":
         exe_fn = executor.execute_fields
     elif operation.operation == "mutation":
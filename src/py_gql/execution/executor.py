@@ -15,7 +15,7 @@ from typing import (
 )
 
 from .._string_utils import stringify_path
-from .._utils import OrderedDict, apply_middlewares, is_iterable
+from .._utils import OrderedDict, chain_middlewares, is_iterable
 from ..exc import (
     CoercionError,
     ResolverError,
@@ -37,7 +37,8 @@ from ..schema import (
 )
 from .default_resolver import default_resolver
 from .instrumentation import Instrumentation
-from .runtime import BlockingRuntime, Runtime
+from .middlewares import field_predicate
+from .runtime import BlockingRuntime, Runtime, is_sync_only
 from .wrappers import (
     GroupedFields,
     ResolutionContext,
@@ -100,19 +101,43 @@ class Executor(ResolutionContext):
             or parent_type.default_resolver
             or self._default_resolver
         )
+        if self._has_field_middlewares:
+            middlewares = self._middlewares_for(parent_type, field_definition)
+            cache_key = (base, middlewares)  # type: Any
+        else:
+            middlewares = self._middlewares
+            cache_key = base
+
         try:
-            return self._resolver_cache[base]
+            return self._resolver_cache[cache_key]
         except KeyError:
             wrapped = (
                 self.runtime.wrap_callable(base)
                 if base is not self._default_resolver
+                and not is_sync_only(base)
                 else base
             )
-            if self._middlewares:
-                wrapped = apply_middlewares(wrapped, self._middlewares)
-            self._resolver_cache[base] = wrapped
+            if middlewares:
+                wrapped = chain_middlewares(wrapped, middlewares)
+            self._resolver_cache[cache_key] = wrapped
             return wrapped
 
+    def _middlewares_for(
+        self, parent_type: ObjectType, field_definition: Field
+    ) -> Tuple[Callable[..., Any], ...]:
+        key = parent_type.name, field_definition.name
+        try:
+            return self._field_middlewares[key]
+        except KeyError:
+            applicable = []
+            for mw in self._middlewares:
+                predicate = field_predicate(mw)
+                if predicate is None or predicate(parent_type, field_definition):
+                    applicable.append(mw)
+
+            middlewares = self._field_middlewares[key] = tuple(applicable)
+            return middlewares
+
     def resolve_type(
         self, value: Any, info: ResolveInfo, abstract_type: GraphQLAbstractType,
     ) -> Optional[ObjectType]:
@@ -356,15 +381,7 @@ class Executor(ResolutionContext):
                 runtime_type,
                 resolved_value,
                 path,
-                self.collect_fields(
-                    runtime_type,
-                    [
-                        selection
-                        for field in nodes
-                        if field.selection_set
-                        for selection in field.selection_set.selections
-                    ],
-                ),
+                self.collect_subfields(runtime_type, nodes),
             )
 
         raise TypeError(
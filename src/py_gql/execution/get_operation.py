@@ -26,11 +26,7 @@ def get_operation(
     Raises:
         InvalidOperationError: No relevant operation can be found.
     """
-    operations = [
-        definition
-        for definition in document.definitions
-        if isinstance(definition, _ast.OperationDefinition)
-    ]
+    operations = document.operations
 
     if not operations:
         raise InvalidOperationError(
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+from typing import Any, Callable, Optional, TypeVar
+
+from ..schema import Field, ObjectType
+
+
+AnyFn = Callable[..., Any]
+Fn = TypeVar("Fn", bound=AnyFn)
+FieldPredicate = Callable[[ObjectType, Field], bool]
+
+
+def field_middleware(predicate: FieldPredicate) -> Callable[[Fn], Fn]:
+    """
+    Restrict a middleware to the fields matching a predicate.
+
+    Middlewares normally wrap the resolution of every field. Fields for which
+    ``predicate(parent_type, field_definition)`` returns ``False`` will be
+    resolved without going through the decorated middleware at all instead
+    of calling it only for it to forward to the next resolver. The predicate
+    is evaluated at most once per field and execution.
+
+    >>> @field_middleware(lambda parent_type, field: field.name == "secret")
+    ... def auth_middleware(next_, root, ctx, info, **args):
+    ...     if not ctx.get("authenticated"):
+    ...         raise Exception("Unauthorized")
+    ...     return next_(root, ctx, info, **args)
+
+    Args:
+        predicate: Callable receiving the parent type and field definition.
+    """
+
+    def decorator(middleware: Fn) -> Fn:
+        middleware._py_gql_field_predicate = predicate  # type: ignore
+        return middleware
+
+    return decorator
+
+
+def field_predicate(middleware: AnyFn) -> Optional[FieldPredicate]:
+    """
+    Get the predicate a middleware has been restricted to with
+    :func:`field_middleware`, if any.
+    """
+    return getattr(middleware, "_py_gql_field_predicate", None)
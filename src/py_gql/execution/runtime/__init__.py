@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from .asyncio import AsyncIORuntime
-from .base import Runtime, SubscriptionRuntime
+from .base import Runtime, SubscriptionRuntime, is_sync_only, sync_only
 from .blocking import BlockingRuntime
 from .threadpool import ThreadPoolRuntime
 
@@ -11,4 +11,6 @@ __all__ = [
     "BlockingRuntime",
     "AsyncIORuntime",
     "ThreadPoolRuntime",
+    "sync_only",
+    "is_sync_only",
 ]
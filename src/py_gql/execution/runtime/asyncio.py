@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import asyncio
 import functools as ft
+import weakref
 from inspect import isawaitable, iscoroutinefunction
 from typing import (
     Any,
@@ -49,7 +50,7 @@ class AsyncIORuntime(SubscriptionRuntime):
     ) -> MaybeAwaitable[T]:
         if (
             self._execute_blocking_functions_in_thread
-            and not iscoroutinefunction(fn)
+            and not _iscoroutinefunction_fast(fn)
         ):
 
             return self.loop.run_in_executor(
@@ -151,7 +152,7 @@ class AsyncIORuntime(SubscriptionRuntime):
     def wrap_callable(self, func: Callable[..., Any]) -> Callable[..., Any]:
         if (
             self._execute_blocking_functions_in_thread
-            and not iscoroutinefunction(func)
+            and not _iscoroutinefunction_fast(func)
         ):
 
             async def wrapped(*args, **kwargs):
@@ -191,3 +192,20 @@ def _isawaitable_fast(value, cache={}, __isawaitable=isawaitable):
     except KeyError:
         res = cache[t] = __isawaitable(value)
         return res
+
+
+def _iscoroutinefunction_fast(
+    fn,
+    cache=weakref.WeakKeyDictionary(),
+    __iscoroutinefunction=iscoroutinefunction,
+):
+    # Resolvers are wrapped once per execution; caching the result avoids going
+    # through `inspect` for every resolver of every query. Weak references
+    # ensure we don't keep dynamically created functions alive.
+    try:
+        return cache[fn]
+    except KeyError:
+        res = cache[fn] = __iscoroutinefunction(fn)
+        return res
+    except TypeError:  # Not hashable or weak referenceable
+        return __iscoroutinefunction(fn)
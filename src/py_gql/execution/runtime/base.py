@@ -7,6 +7,33 @@ from typing import Any, Callable, Iterable, Optional, Tuple, Type, TypeVar
 T = TypeVar("T")
 E = TypeVar("E", bound=Exception)
 AnyFn = Callable[..., Any]
+Fn = TypeVar("Fn", bound=AnyFn)
+
+
+def sync_only(func: Fn) -> Fn:
+    """
+    Mark a blocking function as cheap enough to always be called inline.
+
+    Some runtimes (e.g. :class:`~py_gql.execution.runtime.AsyncIORuntime` and
+    :class:`~py_gql.execution.runtime.ThreadPoolRuntime`) offload blocking
+    resolvers to a thread pool. For trivial resolvers such as attribute
+    lookups, scheduling the call costs much more than the call itself:
+    resolvers decorated with this are always called directly from the
+    executor, whatever the runtime.
+
+    Warning:
+        The function must not perform any blocking I/O, as it would block the
+        event loop when using :class:`~py_gql.execution.runtime.AsyncIORuntime`.
+    """
+    func._py_gql_sync_only = True  # type: ignore
+    return func
+
+
+def is_sync_only(func: AnyFn) -> bool:
+    """
+    Check whether a function has been decorated with :func:`sync_only`.
+    """
+    return getattr(func, "_py_gql_sync_only", False)
 
 
 class Runtime(abc.ABC):
@@ -6,6 +6,7 @@ from typing import (
     Callable,
     Dict,
     List,
+    Mapping,
     Optional,
     Sequence,
     Set,
@@ -27,6 +28,7 @@ from ..utilities import (
     directive_arguments,
     selected_fields,
 )
+from .middlewares import field_predicate
 from .runtime import Runtime
 
 
@@ -49,11 +51,14 @@ class ResolutionContext:
         "fragments",
         "context_value",
         "_grouped_fields",
+        "_subfields",
         "_fragment_type_applies",
         "_field_defs",
         "_argument_values",
         "_resolver_cache",
         "_middlewares",
+        "_has_field_middlewares",
+        "_field_middlewares",
         "_disable_introspection",
         "_errors",
     )
@@ -76,11 +81,19 @@ class ResolutionContext:
         self.variables = variables
         #: Context value
         self.context_value = context_value
-        #: Dict[str, ~ast.FragmentDefinition]: Document fragments
+        #: Mapping[str, ~ast.FragmentDefinition]: Document fragments
         self.fragments = document.fragments
 
         self._disable_introspection = disable_introspection
-        self._middlewares = middlewares or []
+        # Fail early rather than when resolving the first field.
+        self._middlewares = tuple(middlewares) if middlewares else ()
+        if not all(callable(mw) for mw in self._middlewares):
+            raise TypeError("Middleware should be a callable")
+        # Only resolve middlewares per field when some of them are restricted
+        # with ``field_middleware``.
+        self._has_field_middlewares = any(
+            field_predicate(mw) is not None for mw in self._middlewares
+        )
 
         self._errors = []  # type: List[GraphQLResponseError]
 
@@ -88,6 +101,9 @@ class ResolutionContext:
         self._grouped_fields = (
             {}
         )  # type: Dict[Tuple[str, Tuple[ast.Selection, ...]], GroupedFields]
+        self._subfields = (
+            {}
+        )  # type: Dict[Tuple[str, Tuple[ast.Field, ...]], GroupedFields]
         self._fragment_type_applies = (
             {}
         )  # type: Dict[Tuple[str, ast.Type], bool]
@@ -95,7 +111,10 @@ class ResolutionContext:
         self._argument_values = (
             {}
         )  # type: Dict[Tuple[Field, ast.Field], Dict[str, Any]]
-        self._resolver_cache = {}  # type: Dict[Resolver, Resolver]
+        self._resolver_cache = {}  # type: Dict[Any, Resolver]
+        self._field_middlewares = (
+            {}
+        )  # type: Dict[Tuple[str, str], Tuple[Callable[..., Any], ...]]
 
     def add_error(
         self,
@@ -146,6 +165,30 @@ class ResolutionContext:
             self._grouped_fields[cache_key] = grouped_fields
             return grouped_fields
 
+    def collect_subfields(
+        self, parent_type: ObjectType, nodes: Sequence[ast.Field]
+    ) -> GroupedFields:
+        """
+        Collect the merged sub-selections of a list of field nodes.
+
+        This is memoized per type and nodes given that when resolving list
+        fields the same nodes will be completed once per entry.
+        """
+        cache_key = parent_type.name, tuple(nodes)
+        try:
+            return self._subfields[cache_key]
+        except KeyError:
+            self._subfields[cache_key] = subfields = self.collect_fields(
+                parent_type,
+                [
+                    selection
+                    for field in nodes
+                    if field.selection_set
+                    for selection in field.selection_set.selections
+                ],
+            )
+            return subfields
+
     def field_definition(
         self, parent_type: ObjectType, name: str
     ) -> Optional[Field]:
@@ -244,7 +287,7 @@ class ResolveInfo:
         return self._context.variables
 
     @property
-    def fragments(self) -> Dict[str, ast.FragmentDefinition]:
+    def fragments(self) -> Mapping[str, ast.FragmentDefinition]:
         """
         Document fragments.
         """
@@ -6,20 +6,43 @@ See: http://facebook.github.io/graphql/June2018/#sec-Language/#sec-Language
 """
 
 import copy
+import operator
+import sys
+from types import MappingProxyType
 from typing import (
     Any,
     Dict,
-    Iterator,
     List,
+    Mapping,
     Optional,
-    Sequence,
     Tuple,
     Union,
     cast,
 )
 
 
-class Node:
+class _NodeMeta(type):
+    # Computes the per class tables used by Node. This is a metaclass rather
+    # than ``__init_subclass__`` as the latter is not available on Python 3.5.
+    def __init__(cls, name, bases, namespace):
+        super().__init__(name, bases, namespace)
+        slots = []  # type: List[str]
+        for klass in reversed(cls.__mro__):
+            for attr in klass.__dict__.get("__slots__", ()):
+                if attr not in slots:
+                    slots.append(attr)
+
+        # Private slots are used for caching and are not part of the node's
+        # public state.
+        cls._slots = tuple(attr for attr in slots if not attr.startswith("_"))
+        cls._props = tuple(attr for attr in cls._slots if attr != "source")
+        if cls._props:
+            # Fetches all values in a single C call; comparing the resulting
+            # tuples is much faster than comparing attribute by attribute.
+            cls._prop_values = staticmethod(operator.attrgetter(*cls._props))
+
+
+class Node(metaclass=_NodeMeta):
     """
     Base AST node.
     """
@@ -29,38 +52,54 @@ class Node:
     source = None  # type: Optional[str]
     loc = None  # type: Optional[Tuple[int, int]]
 
-    def _props(self) -> Iterator[str]:
-        for attr in cast(Sequence[str], self.__slots__):
-            if attr != "source":
-                yield attr
+    # All slots (including inherited ones) and the subset of them which is
+    # compared / serialized, computed once per class by the metaclass.
+    _slots = ()  # type: Tuple[str, ...]
+    _props = ()  # type: Tuple[str, ...]
+
+    @staticmethod
+    def _prop_values(node: "Node") -> Any:
+        return ()
 
     def __eq__(self, rhs: Any) -> bool:
-        return type(rhs) == type(self) and all(
-            getattr(self, attr) == getattr(rhs, attr) for attr in self._props()
+        return self is rhs or (
+            type(rhs) is type(self)
+            and self._prop_values(self) == rhs._prop_values(rhs)
         )
 
-    def __hash__(self) -> int:
-        return id(self)
+    # Nodes hash by identity; using the default implementation directly avoids
+    # a Python level call on every hash.
+    __hash__ = object.__hash__
 
     def __repr__(self) -> str:
         return "<%s %s>" % (
             self.__class__.__name__,
             ", ".join(
-                "%s=%s" % (attr, getattr(self, attr)) for attr in self._props()
+                "%s=%s" % (attr, getattr(self, attr)) for attr in self._props
             ),
         )
 
+    # Copies bypass __init__ and assign slots directly: this is a lot cheaper
+    # than going through keyword arguments and nodes are already normalised.
     def __copy__(self):
-        return self.__class__(  # type: ignore
-            **{k: getattr(self, k) for k in self.__slots__}  # type: ignore
-        )
+        cls = self.__class__
+        new = cls.__new__(cls)
+        for attr in cls._slots:
+            setattr(new, attr, getattr(self, attr))
+        return new
 
     def __deepcopy__(self, memo):
-        return self.__class__(  # type: ignore
-            **{  # type: ignore
-                k: copy.deepcopy(getattr(self, k), memo) for k in self.__slots__
-            }
-        )
+        cls = self.__class__
+        new = cls.__new__(cls)
+        deepcopy = copy.deepcopy
+        for attr in cls._slots:
+            value = getattr(self, attr)
+            # Strings, None and locations are immutable; skip the deepcopy
+            # dispatch for them as they make up most of the attributes.
+            if value is not None and not isinstance(value, (str, tuple)):
+                value = deepcopy(value, memo)
+            setattr(new, attr, value)
+        return new
 
     copy = __copy__
 
@@ -98,28 +137,33 @@ class Name(Node):
         source: Optional[str] = None,
         loc: Optional[Tuple[int, int]] = None,
     ):
-        self.value = value
+        # Names are a small set of identifiers repeated across documents and
+        # mostly used as dict keys; interning them makes these lookups faster
+        # and avoids keeping a copy per parsed document.
+        self.value = sys.intern(value)
         self.source = source
         self.loc = loc
 
 
 class Definition(Node):
-    pass
+    __slots__ = ()
 
 
 class ExecutableDefinition(Definition):
-    pass
+    __slots__ = ()
 
 
 class Value(Node):
-    pass
+    __slots__ = ()
 
 
 class Type(Node):
-    pass
+    __slots__ = ()
 
 
 class SupportDirectives:
+    __slots__ = ()
+
     directives = NotImplemented  # type: List["Directive"]
 
 
@@ -166,7 +210,7 @@ class NonNullType(Type):
 
 
 class Document(Node):
-    __slots__ = ("source", "loc", "definitions")
+    __slots__ = ("source", "loc", "definitions", "_definitions_index")
 
     def __init__(
         self,
@@ -174,17 +218,61 @@ class Document(Node):
         source: Optional[str] = None,
         loc: Optional[Tuple[int, int]] = None,
     ):
-        self.definitions = definitions or []  # type: List[Definition]
+        self.definitions = [] if definitions is None else definitions
         self.source = source
         self.loc = loc
 
+    def _index(
+        self,
+    ) -> Tuple[List["OperationDefinition"], Mapping[str, "FragmentDefinition"]]:
+        # Definitions are split by kind once and the result reused for as long
+        # as the definitions list holds the same nodes. Nodes can be modified
+        # in place (e.g. by visitors) so we can't just compute this on init.
+        # Renaming a fragment in place is not tracked.
+        definitions = self.definitions
+        cached = getattr(self, "_definitions_index", None)
+        if (
+            cached is not None
+            and len(cached[0]) == len(definitions)
+            and all(map(operator.is_, cached[0], definitions))
+        ):
+            return cached[1], cached[2]
+
+        operations = []  # type: List[OperationDefinition]
+        fragments = {}  # type: Dict[str, FragmentDefinition]
+        for definition in definitions:
+            if isinstance(definition, OperationDefinition):
+                operations.append(definition)
+            elif isinstance(definition, FragmentDefinition):
+                fragments[definition.name.value] = definition
+
+        fragments_view = MappingProxyType(fragments)
+        self._definitions_index = (
+            tuple(definitions),
+            operations,
+            fragments_view,
+        )
+        return operations, fragments_view
+
     @property
-    def fragments(self) -> Dict[str, "FragmentDefinition"]:
-        return {
-            f.name.value: f
-            for f in self.definitions
-            if isinstance(f, FragmentDefinition)
-        }
+    def operations(self) -> List["OperationDefinition"]:
+        """
+        Operation definitions in the order they appear in the document.
+
+        The result is cached and should not be modified.
+        """
+        return self._index()[0]
+
+    @property
+    def fragments(self) -> Mapping[str, "FragmentDefinition"]:
+        """
+        Fragment definitions indexed by name.
+
+        The result is a cached read-only mapping. It is recomputed when the
+        document's definitions change but not when definitions are modified
+        in place, e.g. when renaming a fragment.
+        """
+        return self._index()[1]
 
 
 class OperationDefinition(SupportDirectives, ExecutableDefinition):
@@ -212,9 +300,9 @@ class OperationDefinition(SupportDirectives, ExecutableDefinition):
         self.name = name
         self.selection_set = selection_set
         self.variable_definitions = (
-            variable_definitions or []
-        )  # type: List[VariableDefinition]
-        self.directives = directives or []  # type: List[Directive]
+            [] if variable_definitions is None else variable_definitions
+        )
+        self.directives = [] if directives is None else directives
         self.source = source
         self.loc = loc
 
@@ -255,13 +343,13 @@ class VariableDefinition(SupportDirectives, Node):
         self.variable = variable
         self.type = type
         self.default_value = default_value
-        self.directives = directives or []  # type: List[Directive]
+        self.directives = [] if directives is None else directives
         self.source = source
         self.loc = loc
 
 
 class Selection(Node):
-    pass
+    __slots__ = ()
 
 
 class SelectionSet(Node):
@@ -273,7 +361,7 @@ class SelectionSet(Node):
         source: Optional[str] = None,
         loc: Optional[Tuple[int, int]] = None,
     ):
-        self.selections = selections or []  # type: List[Selection]
+        self.selections = [] if selections is None else selections
         self.source = source
         self.loc = loc
 
@@ -301,8 +389,8 @@ class Field(SupportDirectives, Selection):
     ):
         self.alias = alias
         self.name = name
-        self.arguments = arguments or []  # type: List[Argument]
-        self.directives = directives or []  # type: List[Directive]
+        self.arguments = [] if arguments is None else arguments
+        self.directives = [] if directives is None else directives
         self.selection_set = selection_set
         self.source = source
         self.loc = loc
@@ -339,7 +427,7 @@ class FragmentSpread(SupportDirectives, Selection):
         loc: Optional[Tuple[int, int]] = None,
     ):
         self.name = name
-        self.directives = directives or []  # type: List[Directive]
+        self.directives = [] if directives is None else directives
         self.source = source
         self.loc = loc
 
@@ -362,7 +450,7 @@ class InlineFragment(SupportDirectives, Selection):
         loc: Optional[Tuple[int, int]] = None,
     ):
         self.type_condition = type_condition
-        self.directives = directives or []  # type: List[Directive]
+        self.directives = [] if directives is None else directives
         self.selection_set = selection_set
         self.source = source
         self.loc = loc
@@ -370,6 +458,7 @@ class InlineFragment(SupportDirectives, Selection):
 
 class FragmentDefinition(SupportDirectives, ExecutableDefinition):
     __slots__ = (
+        "source",
         "loc",
         "name",
         "variable_definitions",
@@ -390,10 +479,10 @@ class FragmentDefinition(SupportDirectives, ExecutableDefinition):
     ):
         self.name = name
         self.variable_definitions = (
-            variable_definitions or []
-        )  # type: List[VariableDefinition]
+            [] if variable_definitions is None else variable_definitions
+        )
         self.type_condition = type_condition
-        self.directives = directives or []  # type: List[Directive]
+        self.directives = [] if directives is None else directives
         self.selection_set = selection_set
         self.source = source
         self.loc = loc
@@ -417,11 +506,11 @@ class _StringValue(Value):
 
 
 class IntValue(_StringValue):
-    pass
+    __slots__ = ()
 
 
 class FloatValue(_StringValue):
-    pass
+    __slots__ = ()
 
 
 class StringValue(Value):
@@ -479,7 +568,7 @@ class NullValue(Value):
 
 
 class EnumValue(_StringValue):
-    pass
+    __slots__ = ()
 
 
 class ListValue(Value):
@@ -505,7 +594,7 @@ class ObjectValue(Value):
         source: Optional[str] = None,
         loc: Optional[Tuple[int, int]] = None,
     ):
-        self.fields = fields or []
+        self.fields = [] if fields is None else fields
         self.source = source
         self.loc = loc
 
@@ -537,17 +626,19 @@ class Directive(Node):
         loc: Optional[Tuple[int, int]] = None,
     ):
         self.name = name
-        self.arguments = arguments or []  # type: List[Argument]
+        self.arguments = [] if arguments is None else arguments
         self.source = source
         self.loc = loc
 
 
 class SupportDescription:
+    __slots__ = ()
+
     description = NotImplemented  # type: Optional[StringValue]
 
 
 class TypeSystemDefinition(SupportDirectives, Definition):
-    pass
+    __slots__ = ()
 
 
 class SchemaDefinition(TypeSystemDefinition):
@@ -560,10 +651,10 @@ class SchemaDefinition(TypeSystemDefinition):
         source: Optional[str] = None,
         loc: Optional[Tuple[int, int]] = None,
     ):
-        self.directives = directives or []  # type: List[Directive]
+        self.directives = [] if directives is None else directives
         self.operation_types = (
-            operation_types or []
-        )  # type: List[OperationTypeDefinition]
+            [] if operation_types is None else operation_types
+        )
         self.source = source
         self.loc = loc
 
@@ -585,6 +676,8 @@ class OperationTypeDefinition(Node):
 
 
 class TypeDefinition(SupportDescription, TypeSystemDefinition):
+    __slots__ = ()
+
     name = NotImplemented  # type:  Name
 
 
@@ -600,7 +693,7 @@ class ScalarTypeDefinition(TypeDefinition):
         description: Optional[StringValue] = None,
     ):
         self.name = name
-        self.directives = directives or []  # type: List[Directive]
+        self.directives = [] if directives is None else directives
         self.source = source
         self.loc = loc
         self.description = description
@@ -628,9 +721,9 @@ class ObjectTypeDefinition(TypeDefinition):
         description: Optional[StringValue] = None,
     ):
         self.name = name
-        self.interfaces = interfaces or []  # type: List[NamedType]
-        self.directives = directives or []  # type: List[Directive]
-        self.fields = fields or []  # type: List[FieldDefinition]
+        self.interfaces = [] if interfaces is None else interfaces
+        self.directives = [] if directives is None else directives
+        self.fields = [] if fields is None else fields
         self.source = source
         self.loc = loc
         self.description = description
@@ -658,9 +751,9 @@ class FieldDefinition(SupportDirectives, SupportDescription, Node):
         description: Optional[StringValue] = None,
     ):
         self.name = name
-        self.arguments = arguments or []  # type: List[InputValueDefinition]
+        self.arguments = [] if arguments is None else arguments
         self.type = type
-        self.directives = directives or []  # type: List[Directive]
+        self.directives = [] if directives is None else directives
         self.source = source
         self.loc = loc
         self.description = description
@@ -690,7 +783,7 @@ class InputValueDefinition(SupportDirectives, SupportDescription, Node):
         self.name = name
         self.type = type
         self.default_value = default_value
-        self.directives = directives or []  # type: List[Directive]
+        self.directives = [] if directives is None else directives
         self.source = source
         self.loc = loc
         self.description = description
@@ -709,8 +802,8 @@ class InterfaceTypeDefinition(TypeDefinition):
         description: Optional[StringValue] = None,
     ):
         self.name = name
-        self.directives = directives or []  # type: List[Directive]
-        self.fields = fields or []  # type: List[FieldDefinition]
+        self.directives = [] if directives is None else directives
+        self.fields = [] if fields is None else fields
         self.source = source
         self.loc = loc
         self.description = description
@@ -729,8 +822,8 @@ class UnionTypeDefinition(TypeDefinition):
         description: Optional[StringValue] = None,
     ):
         self.name = name
-        self.directives = directives or []  # type: List[Directive]
-        self.types = types or []  # type: List[NamedType]
+        self.directives = [] if directives is None else directives
+        self.types = [] if types is None else types
         self.source = source
         self.loc = loc
         self.description = description
@@ -749,8 +842,8 @@ class EnumTypeDefinition(TypeDefinition):
         description: Optional[StringValue] = None,
     ):
         self.name = name
-        self.directives = directives or []  # type: List[Directive]
-        self.values = values or []  # type: List[EnumValueDefinition]
+        self.directives = [] if directives is None else directives
+        self.values = [] if values is None else values
         self.source = source
         self.loc = loc
         self.description = description
@@ -768,7 +861,7 @@ class EnumValueDefinition(SupportDirectives, SupportDescription, Node):
         description: Optional[StringValue] = None,
     ):
         self.name = name
-        self.directives = directives or []  # type: List[Directive]
+        self.directives = [] if directives is None else directives
         self.source = source
         self.loc = loc
         self.description = description
@@ -787,15 +880,15 @@ class InputObjectTypeDefinition(TypeDefinition):
         description: Optional[StringValue] = None,
     ):
         self.name = name
-        self.directives = directives or []  # type: List[Directive]
-        self.fields = fields or []  # type: List[InputValueDefinition]
+        self.directives = [] if directives is None else directives
+        self.fields = [] if fields is None else fields
         self.source = source
         self.loc = loc
         self.description = description
 
 
 class TypeSystemExtension(TypeSystemDefinition):
-    pass
+    __slots__ = ()
 
 
 class SchemaExtension(TypeSystemExtension):
@@ -808,15 +901,17 @@ class SchemaExtension(TypeSystemExtension):
         source: Optional[str] = None,
         loc: Optional[Tuple[int, int]] = None,
     ):
-        self.directives = directives or []  # type: List[Directive]
+        self.directives = [] if directives is None else directives
         self.operation_types = (
-            operation_types or []
-        )  # type: List[OperationTypeDefinition]
+            [] if operation_types is None else operation_types
+        )
         self.source = source
         self.loc = loc
 
 
 class TypeExtension(TypeSystemExtension):
+    __slots__ = ()
+
     name = NotImplemented  # type: Name
 
 
@@ -831,7 +926,7 @@ class ScalarTypeExtension(TypeExtension):
         loc: Optional[Tuple[int, int]] = None,
     ):
         self.name = name
-        self.directives = directives or []  # type: List[Directive]
+        self.directives = [] if directives is None else directives
         self.source = source
         self.loc = loc
 
@@ -849,9 +944,9 @@ class ObjectTypeExtension(TypeExtension):
         loc: Optional[Tuple[int, int]] = None,
     ):
         self.name = name
-        self.interfaces = interfaces or []  # type: List[NamedType]
-        self.directives = directives or []  # type: List[Directive]
-        self.fields = fields or []  # type: List[FieldDefinition]
+        self.interfaces = [] if interfaces is None else interfaces
+        self.directives = [] if directives is None else directives
+        self.fields = [] if fields is None else fields
         self.source = source
         self.loc = loc
 
@@ -868,8 +963,8 @@ class InterfaceTypeExtension(TypeExtension):
         loc: Optional[Tuple[int, int]] = None,
     ):
         self.name = name
-        self.directives = directives or []  # type: List[Directive]
-        self.fields = fields or []  # type: List[FieldDefinition]
+        self.directives = [] if directives is None else directives
+        self.fields = [] if fields is None else fields
         self.source = source
         self.loc = loc
 
@@ -886,8 +981,8 @@ class UnionTypeExtension(TypeExtension):
         loc: Optional[Tuple[int, int]] = None,
     ):
         self.name = name
-        self.directives = directives or []  # type: List[Directive]
-        self.types = types or []  # type: List[NamedType]
+        self.directives = [] if directives is None else directives
+        self.types = [] if types is None else types
         self.source = source
         self.loc = loc
 
@@ -904,9 +999,9 @@ class EnumTypeExtension(TypeExtension):
         loc: Optional[Tuple[int, int]] = None,
     ):
         self.name = name
-        self.directives = directives or []  # type: List[Directive]
-        self.values = values or []  # type: List[EnumValueDefinition]
-        self.values = values or []
+        self.directives = [] if directives is None else directives
+        self.values = [] if values is None else values
+        self.values = [] if values is None else values
         self.source = source
         self.loc = loc
 
@@ -923,8 +1018,8 @@ class InputObjectTypeExtension(TypeExtension):
         loc: Optional[Tuple[int, int]] = None,
     ):
         self.name = name
-        self.directives = directives or []  # type: List[Directive]
-        self.fields = fields or []  # type: List[InputValueDefinition]
+        self.directives = [] if directives is None else directives
+        self.fields = [] if fields is None else fields
         self.source = source
         self.loc = loc
 
@@ -949,19 +1044,20 @@ class DirectiveDefinition(SupportDescription, TypeSystemDefinition):
         description: Optional[StringValue] = None,
     ):
         self.name = name
-        self.arguments = arguments or []  # type: List[InputValueDefinition]
-        self.locations = locations or []  # type: List[Name]
+        self.arguments = [] if arguments is None else arguments
+        self.locations = [] if locations is None else locations
         self.source = source
         self.loc = loc
         self.description = description
 
 
-def _ast_to_json(node):
+def _ast_to_json(node: Any) -> Any:
     if isinstance(node, Node):
-        return dict(
-            {attr: _ast_to_json(getattr(node, attr)) for attr in node._props()},
-            __kind__=node.__class__.__name__,
-        )
+        converted = {
+            attr: _ast_to_json(getattr(node, attr)) for attr in node._props
+        }
+        converted["__kind__"] = node.__class__.__name__
+        return converted
     elif isinstance(node, list):
         return [_ast_to_json(v) for v in node]
     else:
@@ -4,7 +4,7 @@ Visitors provide abstractions for traversing and transforming a GraphQL AST.
 """
 
 import functools
-from typing import Optional, TypeVar, Union
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar, Union
 
 from .._utils import classdispatch, map_and_filter
 from ..exc import GraphQLError
@@ -15,6 +15,9 @@ T = TypeVar("T")
 N = TypeVar("N", bound=_ast.Node)
 S = TypeVar("S", bound=_ast.Selection)
 
+_Handlers = Dict[type, Callable[..., Any]]
+_DispatchTables = Tuple[Optional[type], _Handlers, _Handlers]
+
 
 __all__ = (
     "SkipNode",
@@ -452,6 +455,69 @@ class ASTVisitor:
         return definition
 
 
+# Suffix of the DispatchingVisitor methods handling each node class.
+_HANDLER_NAMES = {
+    _ast.Document: "document",
+    _ast.OperationDefinition: "operation_definition",
+    _ast.FragmentDefinition: "fragment_definition",
+    _ast.VariableDefinition: "variable_definition",
+    _ast.Directive: "directive",
+    _ast.Argument: "argument",
+    _ast.SelectionSet: "selection_set",
+    _ast.Field: "field",
+    _ast.FragmentSpread: "fragment_spread",
+    _ast.InlineFragment: "inline_fragment",
+    _ast.NullValue: "null_value",
+    _ast.IntValue: "int_value",
+    _ast.FloatValue: "float_value",
+    _ast.StringValue: "string_value",
+    _ast.BooleanValue: "boolean_value",
+    _ast.EnumValue: "enum_value",
+    _ast.Variable: "variable",
+    _ast.ListValue: "list_value",
+    _ast.ObjectValue: "object_value",
+    _ast.ObjectField: "object_field",
+    _ast.NamedType: "named_type",
+    _ast.ListType: "list_type",
+    _ast.NonNullType: "non_null_type",
+    _ast.SchemaDefinition: "schema_definition",
+    _ast.OperationTypeDefinition: "operation_type_definition",
+    _ast.ScalarTypeDefinition: "scalar_type_definition",
+    _ast.ObjectTypeDefinition: "object_type_definition",
+    _ast.FieldDefinition: "field_definition",
+    _ast.InputValueDefinition: "input_value_definition",
+    _ast.InterfaceTypeDefinition: "interface_type_definition",
+    _ast.UnionTypeDefinition: "union_type_definition",
+    _ast.EnumTypeDefinition: "enum_type_definition",
+    _ast.EnumValueDefinition: "enum_value_definition",
+    _ast.InputObjectTypeDefinition: "input_object_type_definition",
+    _ast.SchemaExtension: "schema_extension",
+    _ast.ScalarTypeExtension: "scalar_type_extension",
+    _ast.ObjectTypeExtension: "object_type_extension",
+    _ast.InterfaceTypeExtension: "interface_type_extension",
+    _ast.UnionTypeExtension: "union_type_extension",
+    _ast.EnumTypeExtension: "enum_type_extension",
+    _ast.InputObjectTypeExtension: "input_object_type_extension",
+    _ast.DirectiveDefinition: "directive_definition",
+}  # type: Dict[type, str]
+
+
+def _build_dispatch_tables(cls: type) -> _DispatchTables:
+    tables = (
+        cls,
+        {
+            node_cls: getattr(cls, "enter_" + name)
+            for node_cls, name in _HANDLER_NAMES.items()
+        },
+        {
+            node_cls: getattr(cls, "leave_" + name)
+            for node_cls, name in _HANDLER_NAMES.items()
+        },
+    )
+    cls._dispatch_tables = tables  # type: ignore
+    return tables
+
+
 class DispatchingVisitor(ASTVisitor):
     """
     Base class for specialized visitors.
@@ -462,109 +528,36 @@ class DispatchingVisitor(ASTVisitor):
     implement ``enter_float_value``.
 
     Default behavior is noop for all node types.
+
+    Note:
+        Handlers are looked up on the class the first time one of its
+        instances visits a node, which means that they cannot be overridden
+        on instances or modified on the class afterwards.
     """
 
+    # Rebuilding the mapping of bound handlers for every node is a significant
+    # cost on large documents, especially when chaining visitors.
+    _dispatch_tables = (None, {}, {})  # type: _DispatchTables
+
     def enter(self, node: N) -> Optional[N]:
-        # Not sure why typechecking doesn't work here, maybe something to do
-        # with the decorator?
-        return classdispatch(  # type: ignore
-            node,
-            {
-                _ast.Document: self.enter_document,
-                _ast.OperationDefinition: self.enter_operation_definition,
-                _ast.FragmentDefinition: self.enter_fragment_definition,
-                _ast.VariableDefinition: self.enter_variable_definition,
-                _ast.Directive: self.enter_directive,
-                _ast.Argument: self.enter_argument,
-                _ast.SelectionSet: self.enter_selection_set,
-                _ast.Field: self.enter_field,
-                _ast.FragmentSpread: self.enter_fragment_spread,
-                _ast.InlineFragment: self.enter_inline_fragment,
-                _ast.NullValue: self.enter_null_value,
-                _ast.IntValue: self.enter_int_value,
-                _ast.FloatValue: self.enter_float_value,
-                _ast.StringValue: self.enter_string_value,
-                _ast.BooleanValue: self.enter_boolean_value,
-                _ast.EnumValue: self.enter_enum_value,
-                _ast.Variable: self.enter_variable,
-                _ast.ListValue: self.enter_list_value,
-                _ast.ObjectValue: self.enter_object_value,
-                _ast.ObjectField: self.enter_object_field,
-                _ast.NamedType: self.enter_named_type,
-                _ast.ListType: self.enter_list_type,
-                _ast.NonNullType: self.enter_non_null_type,
-                _ast.SchemaDefinition: self.enter_schema_definition,
-                _ast.OperationTypeDefinition: self.enter_operation_type_definition,
-                _ast.ScalarTypeDefinition: self.enter_scalar_type_definition,
-                _ast.ObjectTypeDefinition: self.enter_object_type_definition,
-                _ast.FieldDefinition: self.enter_field_definition,
-                _ast.InputValueDefinition: self.enter_input_value_definition,
-                _ast.InterfaceTypeDefinition: self.enter_interface_type_definition,
-                _ast.UnionTypeDefinition: self.enter_union_type_definition,
-                _ast.EnumTypeDefinition: self.enter_enum_type_definition,
-                _ast.EnumValueDefinition: self.enter_enum_value_definition,
-                _ast.InputObjectTypeDefinition: self.enter_input_object_type_definition,
-                _ast.SchemaExtension: self.enter_schema_extension,
-                _ast.ScalarTypeExtension: self.enter_scalar_type_extension,
-                _ast.ObjectTypeExtension: self.enter_object_type_extension,
-                _ast.InterfaceTypeExtension: self.enter_interface_type_extension,
-                _ast.UnionTypeExtension: self.enter_union_type_extension,
-                _ast.EnumTypeExtension: self.enter_enum_type_extension,
-                _ast.InputObjectTypeExtension: self.enter_input_object_type_extension,
-                _ast.DirectiveDefinition: self.enter_directive_definition,
-            },
-        )
+        cls, enter_handlers, _ = self._dispatch_tables
+        if cls is not self.__class__:
+            _, enter_handlers, _ = _build_dispatch_tables(self.__class__)
+        try:
+            handler = enter_handlers[node.__class__]
+        except KeyError:
+            raise TypeError(node.__class__)
+        return handler(self, node)  # type: ignore
 
-    # Not sure why typechecking doesn't work here, maybe something to do
-    # with the decorator?
     def leave(self, node: _ast.Node) -> None:
-        return classdispatch(  # type: ignore
-            node,
-            {
-                _ast.Document: self.leave_document,
-                _ast.OperationDefinition: self.leave_operation_definition,
-                _ast.FragmentDefinition: self.leave_fragment_definition,
-                _ast.VariableDefinition: self.leave_variable_definition,
-                _ast.Directive: self.leave_directive,
-                _ast.Argument: self.leave_argument,
-                _ast.SelectionSet: self.leave_selection_set,
-                _ast.Field: self.leave_field,
-                _ast.FragmentSpread: self.leave_fragment_spread,
-                _ast.InlineFragment: self.leave_inline_fragment,
-                _ast.NullValue: self.leave_null_value,
-                _ast.IntValue: self.leave_int_value,
-                _ast.FloatValue: self.leave_float_value,
-                _ast.StringValue: self.leave_string_value,
-                _ast.BooleanValue: self.leave_boolean_value,
-                _ast.EnumValue: self.leave_enum_value,
-                _ast.Variable: self.leave_variable,
-                _ast.ListValue: self.leave_list_value,
-                _ast.ObjectValue: self.leave_object_value,
-                _ast.ObjectField: self.leave_object_field,
-                _ast.NamedType: self.leave_named_type,
-                _ast.ListType: self.leave_list_type,
-                _ast.NonNullType: self.leave_non_null_type,
-                _ast.SchemaDefinition: self.leave_schema_definition,
-                _ast.OperationTypeDefinition: self.leave_operation_type_definition,
-                _ast.ScalarTypeDefinition: self.leave_scalar_type_definition,
-                _ast.ObjectTypeDefinition: self.leave_object_type_definition,
-                _ast.FieldDefinition: self.leave_field_definition,
-                _ast.InputValueDefinition: self.leave_input_value_definition,
-                _ast.InterfaceTypeDefinition: self.leave_interface_type_definition,
-                _ast.UnionTypeDefinition: self.leave_union_type_definition,
-                _ast.EnumTypeDefinition: self.leave_enum_type_definition,
-                _ast.EnumValueDefinition: self.leave_enum_value_definition,
-                _ast.InputObjectTypeDefinition: self.leave_input_object_type_definition,
-                _ast.SchemaExtension: self.leave_schema_extension,
-                _ast.ScalarTypeExtension: self.leave_scalar_type_extension,
-                _ast.ObjectTypeExtension: self.leave_object_type_extension,
-                _ast.InterfaceTypeExtension: self.leave_interface_type_extension,
-                _ast.UnionTypeExtension: self.leave_union_type_extension,
-                _ast.EnumTypeExtension: self.leave_enum_type_extension,
-                _ast.InputObjectTypeExtension: self.leave_input_object_type_extension,
-                _ast.DirectiveDefinition: self.leave_directive_definition,
-            },
-        )
+        cls, _, leave_handlers = self._dispatch_tables
+        if cls is not self.__class__:
+            _, _, leave_handlers = _build_dispatch_tables(self.__class__)
+        try:
+            handler = leave_handlers[node.__class__]
+        except KeyError:
+            raise TypeError(node.__class__)
+        handler(self, node)
 
     def enter_document(self, node: _ast.Document) -> Optional[_ast.Document]:
         return node
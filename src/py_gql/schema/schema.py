@@ -98,6 +98,7 @@ class Schema(ResolverMap):
         "nodes",
         "_possible_types",
         "_is_valid",
+        "_validation_error",
         "_literal_types_cache",
         "types",
         "directives",
@@ -143,6 +144,7 @@ class Schema(ResolverMap):
             {}
         )  # type: Dict[GraphQLAbstractType, Sequence[ObjectType]]
         self._is_valid = None  # type: Optional[bool]
+        self._validation_error = None  # type: Optional[SchemaError]
         self._literal_types_cache = {}  # type: Dict[_ast.Type, GraphQLType]
 
         self.implementations = defaultdict(
@@ -236,8 +238,18 @@ class Schema(ResolverMap):
             :class:`~py_gql.exc.SchemaError` if the schema is invalid.
         """
         if self._is_valid is None:
-            validate_schema(self)
+            try:
+                validate_schema(self)
+            except SchemaError as err:
+                self._is_valid = False
+                self._validation_error = err
+                raise
             self._is_valid = True
+        elif not self._is_valid:
+            assert self._validation_error is not None
+            # Drop the previous traceback, raise would otherwise keep adding
+            # frames to it every time the cached error is raised.
+            raise self._validation_error.with_traceback(None)
 
     def get_type(self, name: str) -> NamedType:
         """
@@ -622,8 +634,6 @@ def _build_type_map(
         if type_ is None:
             continue
 
-        child_types = []  # type: List[GraphQLType]
-
         inner_type = unwrap_type(type_)
 
         if not isinstance(inner_type, NamedType):
@@ -640,31 +650,38 @@ def _build_type_map(
             continue
 
         type_map[name] = inner_type
-
-        if isinstance(inner_type, UnionType):
-            child_types.extend(inner_type.types)
-
-        if isinstance(inner_type, ObjectType):
-            child_types.extend(inner_type.interfaces)
-
-        if isinstance(inner_type, (ObjectType, InterfaceType)):
-            for field in inner_type.fields:
-                child_types.append(field.type)
-                child_types.extend([arg.type for arg in field.arguments or []])
-
-        if isinstance(inner_type, InputObjectType):
-            for input_field in inner_type.fields:
-                child_types.append(input_field.type)
-
-        type_map.update(_build_type_map(child_types, _type_map=type_map))
+        type_map.update(
+            _build_type_map(_child_types(inner_type), _type_map=type_map)
+        )
 
     if directives:
         directive_types = []  # type: List[GraphQLType]
         for directive in directives:
-            directive_types.extend(
-                [arg.type for arg in directive.arguments or []]
-            )
+            for directive_arg in directive.arguments or []:
+                directive_types.append(directive_arg.type)
 
         type_map.update(_build_type_map(directive_types, _type_map=type_map))
 
     return type_map
+
+
+def _child_types(type_: NamedType) -> List[GraphQLType]:
+    child_types = []  # type: List[GraphQLType]
+
+    if isinstance(type_, UnionType):
+        child_types.extend(type_.types)
+
+    if isinstance(type_, ObjectType):
+        child_types.extend(type_.interfaces)
+
+    if isinstance(type_, (ObjectType, InterfaceType)):
+        for field in type_.fields:
+            child_types.append(field.type)
+            for arg in field.arguments or []:
+                child_types.append(arg.type)
+
+    if isinstance(type_, InputObjectType):
+        for input_field in type_.fields:
+            child_types.append(input_field.type)
+
+    return child_types
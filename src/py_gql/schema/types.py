@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+from types import MappingProxyType
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -82,6 +83,7 @@ class GraphQLCompositeType(NamedType):
 
     _source_fields = NotImplemented  # type: LazySeq[Field]
     _fields = NotImplemented  # type: Optional[Sequence[Field]]
+    _field_map = None  # type: Optional[Mapping[str, Field]]
 
     @property
     def fields(self) -> Sequence["Field"]:
@@ -92,13 +94,28 @@ class GraphQLCompositeType(NamedType):
     @fields.setter
     def fields(self, fields: List["Field"]) -> None:
         self._fields = self._source_fields = fields
+        self._field_map = None
 
     @property
-    def field_map(self) -> Dict[str, "Field"]:
-        return {f.name: f for f in self.fields}
+    def field_map(self) -> Mapping[str, "Field"]:
+        if self._field_map is None:
+            self._field_map = MappingProxyType({f.name: f for f in self.fields})
+        return self._field_map
 
 
 class InputValue:
+
+    __slots__ = (
+        "name",
+        "description",
+        "has_default_value",
+        "node",
+        "_default_value",
+        "_ltype",
+        "_type",
+        "python_name",
+    )
+
     def __init__(
         self,
         name: str,
@@ -191,6 +208,8 @@ class InputField(InputValue):
             Source node used when building type from the SDL
     """
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         return "InputField(%s: %s)" % (self.name, self.type)
 
@@ -681,6 +700,8 @@ class Argument(InputValue):
             Source node used when building type from the SDL
     """
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         return "Argument(%s: %s)" % (self.name, self.type)
 
@@ -735,6 +756,21 @@ class Field:
 
     """
 
+    __slots__ = (
+        "name",
+        "description",
+        "deprecated",
+        "deprecation_reason",
+        "resolver",
+        "subscription_resolver",
+        "_source_args",
+        "_args",
+        "node",
+        "_ltype",
+        "_type",
+        "python_name",
+    )
+
     def __init__(
         self,
         name: str,
@@ -818,7 +854,7 @@ class InterfaceType(GraphQLCompositeType, GraphQLAbstractType, NamedType):
 
         fields (Sequence[py_gql.schema.Field]): Object fields.
 
-        field_map (Dict[str, py_gql.schema.Field]):
+        field_map (Mapping[str, py_gql.schema.Field]):
             Object fields as a map.
 
         resolve_type (Optional[callable]): Type resolver
@@ -882,7 +918,7 @@ class ObjectType(GraphQLCompositeType, NamedType):
 
         fields (Sequence[py_gql.schema.Field]): Object fields.
 
-        field_map (Dict[str, py_gql.schema.Field]):
+        field_map (Mapping[str, py_gql.schema.Field]):
             Object fields as a map.
 
         default_resolver (Optional[Callable[..., Any]]):
@@ -1059,15 +1095,19 @@ class Directive:
         self.node = node
 
 
+_WRAPPING_TYPES = (ListType, NonNullType)
+
+
 def is_input_type(type_: GraphQLType) -> bool:
     """
     Check if a type is an input type.
 
     These types may be used as input types for arguments and directives.
     """
-    return isinstance(
-        unwrap_type(type_), (ScalarType, EnumType, InputObjectType)
-    )
+    # Same as unwrap_type, inlined as this is called a lot during validation.
+    while isinstance(type_, _WRAPPING_TYPES):
+        type_ = type_.type
+    return isinstance(type_, (ScalarType, EnumType, InputObjectType))
 
 
 def is_output_type(type_: GraphQLType) -> bool:
@@ -1076,9 +1116,10 @@ def is_output_type(type_: GraphQLType) -> bool:
 
     These types may be used as output types as the result of fields.
     """
+    while isinstance(type_, _WRAPPING_TYPES):
+        type_ = type_.type
     return isinstance(
-        unwrap_type(type_),
-        (ScalarType, EnumType, ObjectType, InterfaceType, UnionType),
+        type_, (ScalarType, EnumType, ObjectType, InterfaceType, UnionType)
     )
 
 
@@ -1088,6 +1129,6 @@ def unwrap_type(type_: GraphQLType) -> NamedType:
     `ListType` or `NonNullType`.
     """
     cur = type_
-    while isinstance(cur, (ListType, NonNullType)):
+    while isinstance(cur, _WRAPPING_TYPES):
         cur = cur.type
     return cast(NamedType, cur)
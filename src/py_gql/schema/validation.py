@@ -4,8 +4,18 @@ Schema validation utility
 """
 
 import re
-from inspect import Parameter, signature
-from typing import TYPE_CHECKING, Any, Callable, List, Sequence, Set, Union
+from inspect import Parameter, Signature, signature
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Union,
+)
 
 from .._string_utils import quoted_options_list
 from ..exc import SchemaError, SchemaValidationError
@@ -29,7 +39,9 @@ from .types import (
 if TYPE_CHECKING:  # Fix import cycles of types needed for Mypy checking
     from .schema import Schema
 
-VALID_NAME_RE = re.compile(r"^(?!__)[_a-zA-Z][_a-zA-Z0-9]*$")
+# Use \Z as $ also matches before a trailing newline.
+VALID_NAME_RE = re.compile(r"(?!__)[_a-zA-Z][_a-zA-Z0-9]*\Z")
+_match_valid_name = VALID_NAME_RE.match
 RESERVED_NAMES = set(t.name for t in SPECIFIED_SCALAR_TYPES)
 
 VAR_PARAM_KINDS = (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD)
@@ -106,8 +118,11 @@ def _is_valid_name(name: str) -> bool:
 
     >>> _is_valid_name('42')
     False
+
+    >>> _is_valid_name('foo\\n')
+    False
     """
-    return bool(VALID_NAME_RE.match(name))
+    return _match_valid_name(name) is not None
 
 
 # TODO: Most non-lazy attributes could be checked earlier.
@@ -119,6 +134,9 @@ class SchemaValidator:
         self.schema = schema
         self.errors = []  # type: List[SchemaError]
         self.enable_resolver_validation = enable_resolver_validation
+        # Default resolvers are usually shared by many fields, only inspect
+        # them once (keyed by id as resolvers do not need to be hashable).
+        self._signatures = {}  # type: Dict[int, Optional[Signature]]
 
     def __bool__(self) -> bool:
         return not self.errors
@@ -221,6 +239,15 @@ class SchemaValidator:
                 'Type "%s" must define at least one field' % composite_type
             )
 
+        # Default resolvers must be compatible with any field they could be
+        # used for, which usually this means defining a variable keyword
+        # parameter.
+        default_resolver = (
+            composite_type.default_resolver
+            if isinstance(composite_type, ObjectType)
+            else None
+        ) or self.schema.default_resolver
+
         fieldnames = set()  # type: Set[str]
         for field in composite_type.fields:
 
@@ -262,20 +289,7 @@ class SchemaValidator:
 
             # Check that the resolver won't break when being called by the
             # execution layer.
-
-            # Default resolvers must be compatible with any field they could be
-            # used for, which usually this means defining a variable keyword
-            # parameter.
-
-            resolver = (
-                field.resolver
-                or (
-                    composite_type.default_resolver
-                    if isinstance(composite_type, ObjectType)
-                    else None
-                )
-                or self.schema.default_resolver
-            )
+            resolver = field.resolver or default_resolver
 
             if resolver and self.enable_resolver_validation:
                 self._validate_resolver_arguments(
@@ -284,17 +298,27 @@ class SchemaValidator:
 
             fieldnames.add(field.name)
 
+    def _signature(self, resolver: Callable[..., Any]) -> Optional[Signature]:
+        try:
+            return self._signatures[id(resolver)]
+        except KeyError:
+            try:
+                sig = signature(resolver)  # type: Optional[Signature]
+            except ValueError:
+                # In some cases (mostly C Extensions) this can fail, in this
+                # case we fallback to the previous behaviour of not validating
+                # and assuming correctness.
+                # This also seems to affect lambda functions when using Cython
+                # (https://github.com/cython/cython/issues/2983)
+                sig = None
+            self._signatures[id(resolver)] = sig
+            return sig
+
     def _validate_resolver_arguments(
         self, path: str, args: Sequence[Argument], resolver: Callable[..., Any],
     ) -> None:
-        try:
-            sig = signature(resolver)
-        except ValueError:
-            # In some cases (mostly C Extensions) this can fail, in this case
-            # we fallback to the previous behaviour of not validating and
-            # assuming correctness.
-            # This also seems to affect lambda functions when using Cython
-            # (https://github.com/cython/cython/issues/2983)
+        sig = self._signature(resolver)
+        if sig is None:
             return
 
         params = list(sig.parameters.values())
@@ -384,8 +408,10 @@ class SchemaValidator:
     def validate_implementation(
         self, type_: ObjectType, interface: InterfaceType
     ) -> None:
+        # argument_map is rebuilt on every access.
+        object_fields = type_.field_map
         for field in interface.fields:
-            object_field = type_.field_map.get(field.name, None)
+            object_field = object_fields.get(field.name, None)
             interface_path = "%s.%s" % (interface.name, field.name)
             obj_path = "%s.%s" % (type_, field.name)
 
@@ -403,8 +429,9 @@ class SchemaValidator:
                 )
                 continue
 
+            object_args = object_field.argument_map
             for arg in field.arguments:
-                object_arg = object_field.argument_map.get(arg.name, None)
+                object_arg = object_args.get(arg.name, None)
 
                 if object_arg is None:
                     self.add_error(
@@ -430,9 +457,9 @@ class SchemaValidator:
 
                 # TODO: Validate default values
 
+            interface_args = field.argument_map
             for arg in object_field.arguments:
-                interface_arg = field.argument_map.get(arg.name, None)
-                if interface_arg is None:
+                if arg.name not in interface_args:
                     if isinstance(arg.type, NonNullType):
                         self.add_error(
                             'Object field argument "%s.%s" is of required type '
@@ -1,7 +1,18 @@
 # -*- coding: utf-8 -*-
 
 import functools as ft
-from typing import Dict, List, Mapping, Optional, Type, TypeVar, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from .._utils import lazy
 from ..exc import ExtensionError, SDLError
@@ -31,7 +42,7 @@ from ..schema.scalars import default_scalar
 from ..utilities import directive_arguments, value_from_ast
 
 
-TTypeExtension = TypeVar("TTypeExtension", bound=Type[_ast.TypeExtension])
+TTypeExtension = TypeVar("TTypeExtension", bound=_ast.TypeExtension)
 
 
 def _default_type_map() -> Dict[str, NamedType]:
@@ -67,6 +78,7 @@ class ASTTypeBuilder:
         "_cache",
         "_extended_cache",
         "_extensions",
+        "_builders",
     )
 
     def __init__(
@@ -84,11 +96,24 @@ class ASTTypeBuilder:
         self._extensions = type_extensions
         self._cache.update(additional_types)
 
+        self._builders = {
+            _ast.ObjectTypeDefinition: self._build_object_type,
+            _ast.InterfaceTypeDefinition: self._build_interface_type,
+            _ast.EnumTypeDefinition: self._build_enum_type,
+            _ast.UnionTypeDefinition: self._build_union_type,
+            _ast.ScalarTypeDefinition: self._build_scalar_type,
+            _ast.InputObjectTypeDefinition: self._build_input_object_type,
+        }  # type: Dict[Type[_ast.TypeDefinition], Callable[[Any], GraphQLType]]
+
     def _collect_extensions(
-        self, target_name: str, ext_type: TTypeExtension
+        self, target_name: str, ext_type: Type[TTypeExtension]
     ) -> List[TTypeExtension]:
-        res = []
-        for ext in self._extensions.get(target_name) or []:
+        extensions = self._extensions.get(target_name)
+        if not extensions:
+            return []
+
+        res = []  # type: List[TTypeExtension]
+        for ext in extensions:
             if not isinstance(ext, ext_type):
                 raise ExtensionError(
                     "Expected %s when extending %s but got %s"
@@ -100,7 +125,7 @@ class ASTTypeBuilder:
                     [ext],
                 )
 
-            res.append(cast(TTypeExtension, ext))
+            res.append(ext)
 
         return res
 
@@ -112,41 +137,36 @@ class ASTTypeBuilder:
         elif isinstance(type_node, _ast.ListType):
             return ListType(self.build_type(type_node.type), node=type_node)
         else:
+            cache = self._cache
             type_name = type_node.name.value  # type: ignore
 
+            built = cache.get(type_name)
+            if built is not None:
+                return built
+
+            if isinstance(type_node, _ast.NamedType):
+                try:
+                    type_def = self._type_defs[type_name]
+                except KeyError:
+                    raise SDLError(
+                        "Type %s not found in document" % type_name,
+                        [type_node],
+                    )
+            else:
+                type_def = cast(_ast.TypeDefinition, type_node)
+
             try:
-                return self._cache[type_name]
+                builder = self._builders[type(type_def)]
             except KeyError:
-                if isinstance(type_node, _ast.NamedType):
-                    try:
-                        type_def = self._type_defs[type_name]
-                    except KeyError:
-                        raise SDLError(
-                            "Type %s not found in document" % type_name,
-                            [type_node],
-                        )
-                else:
-                    type_def = cast(_ast.TypeDefinition, type_node)
-
-                if isinstance(type_def, _ast.ObjectTypeDefinition):
-                    built = self._build_object_type(
-                        type_def
-                    )  # type: GraphQLType
-                elif isinstance(type_def, _ast.InterfaceTypeDefinition):
-                    built = self._build_interface_type(type_def)
-                elif isinstance(type_def, _ast.EnumTypeDefinition):
-                    built = self._build_enum_type(type_def)
-                elif isinstance(type_def, _ast.UnionTypeDefinition):
-                    built = self._build_union_type(type_def)
-                elif isinstance(type_def, _ast.ScalarTypeDefinition):
-                    built = self._build_scalar_type(type_def)
-                elif isinstance(type_def, _ast.InputObjectTypeDefinition):
-                    built = self._build_input_object_type(type_def)
+                # Subclasses of the definition nodes.
+                for kind, builder in self._builders.items():
+                    if isinstance(type_def, kind):
+                        break
                 else:
                     raise TypeError(type(type_def))
 
-                self._cache[type_name] = built
-                return built
+            built = cache[type_name] = builder(type_def)
+            return built
 
     def build_directive(
         self, directive_def: _ast.DirectiveDefinition
@@ -535,4 +555,5 @@ def _deprecation_reason(
 
 
 def _desc(node: _ast.SupportDescription) -> Optional[str]:
-    return node.description.value if node.description else None
+    description = node.description
+    return description.value if description is not None else None
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 
-import collections
 from typing import (
     Dict,
     List,
@@ -204,9 +203,9 @@ def extend_schema(
 
     if not (
         schema_exts
-        or (set(type_defs.keys()) - set(schema.types.keys()))
+        or not (type_defs.keys() <= schema.types.keys())
         or type_exts
-        or (set(directive_defs.keys()) - set(schema.directives.keys()))
+        or not (directive_defs.keys() <= schema.directives.keys())
     ):
         return schema
 
@@ -315,7 +314,7 @@ def _document_ast(document: Union[str, _ast.Document]) -> _ast.Document:
     elif isinstance(document, _ast.Document):
         return document
     else:
-        TypeError("Expected Document but got %s" % type(document))
+        raise TypeError("Expected Document but got %s" % type(document))
 
 
 def _collect_extensions(  # noqa: C901
@@ -329,9 +328,7 @@ def _collect_extensions(  # noqa: C901
     schema_exts = []  # type: List[_ast.SchemaExtension]
     type_defs = {}  # type: Dict[str, _ast.TypeDefinition]
     _type_exts = []  # type: List[_ast.TypeExtension]
-    type_exts = collections.defaultdict(
-        list
-    )  # type: Dict[str, List[_ast.TypeExtension]]
+    type_exts = {}  # type: Dict[str, List[_ast.TypeExtension]]
     directive_defs = {}  # type: Dict[str, _ast.DirectiveDefinition]
 
     for definition in document.definitions:
@@ -384,6 +381,6 @@ def _collect_extensions(  # noqa: C901
             else:
                 continue
         else:
-            type_exts[target].append(ext)
+            type_exts.setdefault(target, []).append(ext)
 
-    return schema_exts, type_defs, directive_defs, dict(type_exts)
+    return schema_exts, type_defs, directive_defs, type_exts
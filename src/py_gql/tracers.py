@@ -4,23 +4,25 @@ Collection of useful tracers implementations.
 """
 
 import datetime
-from typing import Any, Dict, Optional, Tuple, Union, cast
+import time
+from typing import Any, Dict, List, Optional, Union
 
-from ._utils import OrderedDict
 from .execution import GraphQLExtension, Instrumentation, ResolveInfo
 
 
 __all__ = ("TimingTracer", "ApolloTracer")
 
 
-def _ns(
-    start: Optional[datetime.datetime], end: Optional[datetime.datetime]
-) -> Optional[int]:
-    return (
-        int((end - start).total_seconds() * 1e9)
-        if (end is not None and start is not None)
-        else None
-    )
+try:
+    _perf_counter_ns = time.perf_counter_ns
+except AttributeError:  # Python < 3.7
+
+    def _perf_counter_ns() -> int:
+        return int(time.perf_counter() * 1e9)
+
+
+def _ns(start: Optional[int], end: Optional[int]) -> Optional[int]:
+    return end - start if (end is not None and start is not None) else None
 
 
 def _rfc3339(ts: Optional[datetime.datetime]) -> Optional[str]:
@@ -28,65 +30,85 @@ def _rfc3339(ts: Optional[datetime.datetime]) -> Optional[str]:
 
 
 class FieldTiming:
-    __slots__ = ("info", "start", "end")
+    # Only keep what's needed to report on the field and not the ResolveInfo
+    # object itself as it holds onto the whole execution.
+    __slots__ = (
+        "path",
+        "parent_type",
+        "field_name",
+        "return_type",
+        "start",
+        "end",
+    )
 
     def __init__(self, info: ResolveInfo):
-        self.info = info
-        self.start = datetime.datetime.utcnow()
-        self.end = None  #  type: Optional[datetime.datetime]
+        self.path = list(info.path)  # type: List[Union[int, str]]
+        self.parent_type = info.parent_type.name
+        self.field_name = info.field_definition.name
+        self.return_type = str(info.field_definition.type)
+        self.start = _perf_counter_ns()
+        # 0 until the field has been resolved.
+        self.end = 0
 
 
 class TimingTracer(Instrumentation):
     """
     Default implementation for tracers that collect GraphQL execution timing.
 
-    This uses :py:mod:`datetime` module and all times are collected as UTC.
+    The wall clock time at which the query started and ended are collected as
+    UTC datetimes (:attr:`start_time` and :attr:`end_time`), all other timings
+    are collected in nanoseconds from the :py:func:`time.perf_counter` clock.
     """
 
     def __init__(self):
-        self.fields = (
-            OrderedDict()
-        )  # type: Dict[Tuple[Union[str, int]], FieldTiming]
-        self.start = None  # type: Optional[datetime.datetime]
-        self.end = None  # type: Optional[datetime.datetime]
-        self.parse_end = None  # type: Optional[datetime.datetime]
-        self.parse_start = None  # type: Optional[datetime.datetime]
-        self.query_end = None  # type: Optional[datetime.datetime]
-        self.query_start = None  # type: Optional[datetime.datetime]
-        self.validation_end = None  # type: Optional[datetime.datetime]
-        self.validation_start = None  # type: Optional[datetime.datetime]
+        self.fields = []  # type: List[FieldTiming]
+        # Fields which have started resolving, by id of their ResolveInfo
+        # which is shared between on_field_start and on_field_end.
+        self._pending_fields = {}  # type: Dict[int, FieldTiming]
+        self.start_time = None  # type: Optional[datetime.datetime]
+        self.end_time = None  # type: Optional[datetime.datetime]
+        self.start = None  # type: Optional[int]
+        self.end = None  # type: Optional[int]
+        self.parse_end = None  # type: Optional[int]
+        self.parse_start = None  # type: Optional[int]
+        self.query_end = None  # type: Optional[int]
+        self.query_start = None  # type: Optional[int]
+        self.validation_end = None  # type: Optional[int]
+        self.validation_start = None  # type: Optional[int]
 
     def on_query_start(self):
-        self.start = datetime.datetime.utcnow()
+        self.start_time = datetime.datetime.utcnow()
+        self.start = _perf_counter_ns()
 
     def on_query_end(self):
-        self.end = datetime.datetime.utcnow()
+        self.end = _perf_counter_ns()
+        self.end_time = datetime.datetime.utcnow()
 
     def on_execution_start(self):
-        self.query_start = datetime.datetime.utcnow()
+        self.query_start = _perf_counter_ns()
 
     def on_execution_end(self):
-        self.query_end = datetime.datetime.utcnow()
+        self.query_end = _perf_counter_ns()
 
     def on_parsing_start(self):
-        self.parse_start = datetime.datetime.utcnow()
+        self.parse_start = _perf_counter_ns()
 
     def on_parsing_end(self):
-        self.parse_end = datetime.datetime.utcnow()
+        self.parse_end = _perf_counter_ns()
 
     def on_validation_start(self):
-        self.validation_start = datetime.datetime.utcnow()
+        self.validation_start = _perf_counter_ns()
 
     def on_validation_end(self):
-        self.validation_end = datetime.datetime.utcnow()
+        self.validation_end = _perf_counter_ns()
 
     def on_field_start(self, _root: Any, _ctx: Any, info: ResolveInfo) -> None:
-        self.fields[tuple(info.path)] = FieldTiming(info)  # type: ignore
+        field_timing = FieldTiming(info)
+        self.fields.append(field_timing)
+        self._pending_fields[id(info)] = field_timing
 
     def on_field_end(self, _root: Any, _ctx: Any, info: ResolveInfo) -> None:
-        self.fields[
-            tuple(info.path)  # type: ignore
-        ].end = datetime.datetime.utcnow()  # type: ignore
+        self._pending_fields.pop(id(info)).end = _perf_counter_ns()
 
 
 class ApolloTracer(TimingTracer, GraphQLExtension):
@@ -103,26 +125,26 @@ class ApolloTracer(TimingTracer, GraphQLExtension):
 
     def _field(self, field_timing: FieldTiming) -> Dict[str, Any]:
         return {
-            "path": list(field_timing.info.path),
-            "parentType": field_timing.info.parent_type.name,
-            "fieldName": field_timing.info.field_definition.name,
-            "returnType": str(field_timing.info.field_definition.type),
-            "startOffset": _ns(
-                cast(datetime.datetime, self.start), field_timing.start
-            ),
-            "duration": _ns(
-                field_timing.start, cast(datetime.datetime, field_timing.end)
+            "path": field_timing.path,
+            "parentType": field_timing.parent_type,
+            "fieldName": field_timing.field_name,
+            "returnType": field_timing.return_type,
+            "startOffset": _ns(self.start, field_timing.start),
+            "duration": (
+                field_timing.end - field_timing.start
+                if field_timing.end
+                else None
             ),
         }
 
     def payload(self):
         return {
             "version": 1,
-            "startTime": _rfc3339(self.start),
-            "endTime": _rfc3339(self.end),
+            "startTime": _rfc3339(self.start_time),
+            "endTime": _rfc3339(self.end_time),
             "duration": _ns(self.start, self.end),
             "execution": (
-                {"resolvers": [self._field(ft) for ft in self.fields.values()]}
+                {"resolvers": [self._field(ft) for ft in self.fields]}
                 if self.fields
                 else None
             ),
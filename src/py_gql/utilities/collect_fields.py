@@ -195,6 +195,10 @@ def _skip_selection(
     node: Union[ast.Field, ast.InlineFragment, ast.FragmentSpread],
     variables: Mapping[str, Any],
 ) -> bool:
+    # Most selections don't have any directive, skip looking them up.
+    if not node.directives:
+        return False
+
     skip = directive_arguments(SkipDirective, node, variables=variables)
     include = directive_arguments(IncludeDirective, node, variables=variables)
     skipped = skip is not None and skip["if"]
@@ -3,7 +3,7 @@
 from typing import Any, Dict, List, Optional
 
 from ..exc import ValidationError
-from ..lang.ast import Document, Field, OperationDefinition
+from ..lang.ast import Document, Field
 from ..schema import Schema
 from .collect_fields import selected_fields
 
@@ -63,10 +63,7 @@ class MaxDepthValidationRule:
         depth = None  # type: Optional[int]
         errors = []  # type: List[ValidationError]
 
-        for op in doc.definitions:
-            if not isinstance(op, OperationDefinition):
-                continue
-
+        for op in doc.operations:
             if self.operation_name and not (
                 op.name and op.name.value == self.operation_name
             ):
@@ -6,7 +6,7 @@ Validation rules defined in `the specification`_.
 """
 
 from collections import defaultdict
-from typing import Dict, List, Set, Tuple, cast
+from typing import Dict, List, Set, Tuple
 
 from ..._string_utils import infer_suggestions, quoted_options_list
 from ..._utils import OrderedDict, deduplicate
@@ -69,6 +69,8 @@ class ExecutableDefinitionsChecker(ValidationVisitor):
     Unnecessary if parser was run with ``allow_type_system=False``.
     """
 
+    requires_type_info = False
+
     def enter_document(self, node):
         skip_doc = False
         for definition in node.definitions:
@@ -96,6 +98,8 @@ class UniqueOperationNameChecker(ValidationVisitor):
     unique names.
     """
 
+    requires_type_info = False
+
     def __init__(self, schema, type_info):
         super(UniqueOperationNameChecker, self).__init__(schema, type_info)
         self._names = set()  # type: Set[str]
@@ -115,6 +119,8 @@ class LoneAnonymousOperationChecker(ValidationVisitor):
     operation definition.
     """
 
+    requires_type_info = False
+
     def enter_document(self, node):
         operation_definitions = [
             d
@@ -137,6 +143,8 @@ class SingleFieldSubscriptionsChecker(ValidationVisitor):
     root field.
     """
 
+    requires_type_info = False
+
     def enter_operation_definition(self, node):
         if node.operation == "subscription":
             if len(node.selection_set.selections) != 1:
@@ -157,6 +165,8 @@ class KnownTypeNamesChecker(ValidationVisitor):
     type schema.
     """
 
+    requires_type_info = False
+
     def _skip(self, _):
         raise SkipNode()
 
@@ -184,6 +194,8 @@ class FragmentsOnCompositeTypesChecker(ValidationVisitor):
     union), the type condition must also be a composite type.
     """
 
+    requires_type_info = False
+
     def enter_inline_fragment(self, node):
         if node.type_condition:
             type_ = self.schema.get_type_from_literal(node.type_condition)
@@ -212,6 +224,8 @@ class VariablesAreInputTypesChecker(ValidationVisitor):
     input types (scalar, enum, or input object).
     """
 
+    requires_type_info = False
+
     def enter_variable_definition(self, node):
         def _err():
             self.add_error(
@@ -329,6 +343,8 @@ class UniqueFragmentNamesChecker(ValidationVisitor):
     names.
     """
 
+    requires_type_info = False
+
     def __init__(self, schema, type_info):
         super(UniqueFragmentNamesChecker, self).__init__(schema, type_info)
         self._names = set()  # type: Set[str]
@@ -348,6 +364,8 @@ class KnownFragmentNamesChecker(ValidationVisitor):
     refer to fragments defined in the same document.
     """
 
+    requires_type_info = False
+
     def __init__(self, schema, type_info):
         super(KnownFragmentNamesChecker, self).__init__(schema, type_info)
 
@@ -373,6 +391,8 @@ class NoUnusedFragmentsChecker(ValidationVisitor):
     operations.
     """
 
+    requires_type_info = False
+
     def __init__(self, schema, type_info):
         super(NoUnusedFragmentsChecker, self).__init__(schema, type_info)
         self._fragments = set()  # type: Set[str]
@@ -452,6 +472,8 @@ class NoFragmentCyclesChecker(ValidationVisitor):
     A GraphQL Document is only valid if fragment definitions are not cyclic.
     """
 
+    requires_type_info = False
+
     def __init__(self, schema, type_info):
         super(NoFragmentCyclesChecker, self).__init__(schema, type_info)
         self._spreads = OrderedDict()  # type: Dict[str, List[str]]
@@ -523,6 +545,8 @@ class UniqueVariableNamesChecker(ValidationVisitor):
     named.
     """
 
+    requires_type_info = False
+
     def enter_operation_definition(self, _node):
         self._variables = set()  # type: Set[str]
 
@@ -606,6 +630,8 @@ class KnownDirectivesChecker(ValidationVisitor):
     schema and legally positioned.
     """
 
+    requires_type_info = False
+
     def __init__(self, schema, type_info):
         super(KnownDirectivesChecker, self).__init__(schema, type_info)
         self._ancestors = []  # type: List[_ast.Node]
@@ -666,12 +692,12 @@ class KnownDirectivesChecker(ValidationVisitor):
     def _current_location(self):
         ancestor = self._ancestors[-1]
         kind = type(ancestor)
-        if kind is _ast.OperationDefinition:
+        if isinstance(ancestor, _ast.OperationDefinition):
             return {
                 "query": "QUERY",
                 "mutation": "MUTATION",
                 "subscription": "SUBSCRIPTION",
-            }.get(cast(_ast.OperationDefinition, ancestor).operation, "QUERY")
+            }.get(ancestor.operation, "QUERY")
 
         if kind is _ast.InputValueDefinition:
             parent = self._ancestors[-2]
@@ -724,6 +750,8 @@ class UniqueDirectivesPerLocationChecker(ValidationVisitor):
     are uniquely named.
     """
 
+    requires_type_info = False
+
     def _validate_unique_directive_names(self, node):
         seen = set()  # type: Set[str]
         for directive in node.directives:
@@ -809,6 +837,8 @@ class UniqueArgumentNamesChecker(ValidationVisitor):
     are uniquely named.
     """
 
+    requires_type_info = False
+
     def _check_duplicate_args(self, node):
         argnames = set()  # type: Set[str]
         for arg in node.arguments:
@@ -925,6 +955,8 @@ class UniqueInputFieldNamesChecker(ValidationVisitor):
     uniquely named.
     """
 
+    requires_type_info = False
+
     def __init__(self, schema, type_info):
         super(UniqueInputFieldNamesChecker, self).__init__(schema, type_info)
         self._stack = []  # type: List[Tuple[_ast.ObjectValue, Set[str]]]
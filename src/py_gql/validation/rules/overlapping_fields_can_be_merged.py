@@ -9,7 +9,6 @@ from typing import (
     Set,
     Tuple,
     TypeVar,
-    cast,
 )
 
 from ..._utils import OrderedDict, deduplicate, flatten
@@ -128,10 +127,11 @@ class OverlappingFieldsCanBeMergedChecker(ValidationVisitor):
         )
 
     def enter_selection_set(self, node):
+        parent_type = (
+            self.type_info.parent_type
+        )  # type: Optional[GraphQLCompositeType]
         conflicts = find_conflicts_within_selection_set(
-            self.ctx,
-            node,
-            cast(GraphQLCompositeType, self.type_info.parent_type),
+            self.ctx, node, parent_type
         )  # type: List[Conflict]
 
         for response_name, reason, locs in conflicts:
@@ -144,7 +144,9 @@ class OverlappingFieldsCanBeMergedChecker(ValidationVisitor):
 
 
 def find_conflicts_within_selection_set(
-    ctx: Context, selection_set: _ast.SelectionSet, parent_type: GraphQLType
+    ctx: Context,
+    selection_set: _ast.SelectionSet,
+    parent_type: Optional[GraphQLType],
 ) -> List[Conflict]:
     """
     Find all conflicts found "within" a selection set, including those found
@@ -92,16 +92,27 @@ def default_validator(
     In order to use this with :func:`~py_gql.validation.validate_ast` and custom
     visitor classes a lambda or partial should be created.
     """
+    if not validators or not document.definitions:
+        return []
+
     type_info = TypeInfoVisitor(schema)
 
     visitors = [cls(schema, type_info) for cls in validators]
 
     # Type info NEEDS to be first to be accurately used inside other validators
     # so when a validator enters node the type stack has already been updated.
-    validator = ChainedVisitor(type_info, *visitors)
+    # It's only a cost when no validator uses it, in which case it is skipped.
+    if any(cls.requires_type_info for cls in validators):
+        validator = ChainedVisitor(type_info, *visitors)
+    else:
+        validator = ChainedVisitor(*visitors)
     validator.visit(document)
 
-    return [error for visitor in visitors for error in visitor.errors]
+    errors = []  # type: List[ValidationError]
+    for visitor in visitors:
+        if visitor.errors:
+            errors.extend(visitor.errors)
+    return errors
 
 
 def validate_ast(
@@ -136,10 +147,7 @@ def validate_ast(
     if validators is None:
         validators = [default_validator]
 
-    return ValidationResult(
-        [
-            error
-            for validator in validators
-            for error in validator(schema, document, variables)
-        ]
-    )
+    errors = []  # type: List[ValidationError]
+    for validator in validators:
+        errors.extend(validator(schema, document, variables))
+    return ValidationResult(errors)
@@ -1,8 +1,19 @@
 # -*- coding: utf-8 -*-
 
-from typing import List, Mapping, Optional, Sequence, Tuple, TypeVar, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
-from .._utils import DefaultOrderedDict, OrderedDict, deduplicate, find_one
+from .._utils import DefaultOrderedDict, OrderedDict, deduplicate
 from ..exc import UnknownEnumValue, UnknownType, ValidationError
 from ..lang import ast as _ast
 from ..lang.visitor import DispatchingVisitor
@@ -20,22 +31,20 @@ from ..schema import (
     ObjectType,
     ScalarType,
     Schema,
-    is_input_type,
-    is_output_type,
-    unwrap_type,
+    UnionType,
 )
 from ..schema.introspection import (
     SCHEMA_INTROSPECTION_FIELD,
     TYPE_INTROSPECTION_FIELD,
     TYPE_NAME_INTROSPECTION_FIELD,
 )
+from ..schema.types import _WRAPPING_TYPES
 
 
 T = TypeVar("T")
 N = TypeVar("N", bound=_ast.Node)
 MMap = Mapping[str, Mapping[str, T]]
 LMap = Mapping[str, List[T]]
-OptList = List[Optional[T]]
 
 VariableUsages = MMap[
     Tuple[
@@ -45,28 +54,86 @@ VariableUsages = MMap[
     ]
 ]
 
+# (type, parent_type, input_type, parent_input_type, field, input_value_def)
+_Frame = Tuple[
+    Optional[GraphQLCompositeType],
+    Optional[GraphQLCompositeType],
+    Optional[GraphQLType],
+    Optional[InputObjectType],
+    Optional[Field],
+    Optional[InputValue],
+]
+
+
+def _unwrap(type_: Any) -> Any:
+    # Same as unwrap_type without the Optional handling.
+    while isinstance(type_, _WRAPPING_TYPES):
+        type_ = type_.type
+    return type_
+
+
+def _named_type_check(*classes: type) -> Callable[[Any], bool]:
+    """
+    Build a function checking whether a type unwraps to an instance of any of
+    the given classes.
+
+    This is used instead of ``isinstance`` / :func:`py_gql.schema.is_input_type`
+    and :func:`py_gql.schema.is_output_type` by :class:`TypeInfoVisitor` as
+    these run multiple times for every node; results are cached per class so
+    subclasses are still supported.
+    """
+    cache = {}  # type: Dict[type, bool]
 
-def _peek(
-    lst: Sequence[T], count: int = 1, default: Optional[T] = None
-) -> Optional[T]:
-    return lst[-1 * count] if len(lst) >= count else default
+    def check(type_: Any) -> bool:
+        cls = _unwrap(type_).__class__
+        try:
+            return cache[cls]
+        except KeyError:
+            result = cache[cls] = issubclass(cls, classes)
+            return result
+
+    return check
+
+
+_is_input_type = _named_type_check(ScalarType, EnumType, InputObjectType)
+_is_output_type = _named_type_check(
+    ScalarType, EnumType, ObjectType, InterfaceType, UnionType
+)
+_is_composite_type = _named_type_check(GraphQLCompositeType)
+_is_field_container = _named_type_check(ObjectType, InterfaceType)
+_is_input_object_type = _named_type_check(InputObjectType)
+_is_enum_type = _named_type_check(EnumType)
+
+
+def _type_literal_key(type_node: _ast.Type) -> str:
+    # Printed form of a type literal, e.g. ``[User!]``.
+    if isinstance(type_node, _ast.NonNullType):
+        return _type_literal_key(type_node.type) + "!"
+    elif isinstance(type_node, _ast.ListType):
+        return "[%s]" % _type_literal_key(type_node.type)
+    return type_node.name.value  # type: ignore
+
+
+_QUERY_INTROSPECTION_FIELDS = {
+    SCHEMA_INTROSPECTION_FIELD.name: SCHEMA_INTROSPECTION_FIELD,
+    TYPE_INTROSPECTION_FIELD.name: TYPE_INTROSPECTION_FIELD,
+}
 
 
 def _get_field_def(schema, parent_type, field):
     name = field.name.value
     if parent_type is schema.query_type:
-        if name == SCHEMA_INTROSPECTION_FIELD.name:
-            return SCHEMA_INTROSPECTION_FIELD
-        if name == TYPE_INTROSPECTION_FIELD.name:
-            return TYPE_INTROSPECTION_FIELD
+        introspection_field = _QUERY_INTROSPECTION_FIELDS.get(name)
+        if introspection_field is not None:
+            return introspection_field
 
     if (
-        isinstance(parent_type, GraphQLCompositeType)
-        and name == TYPE_NAME_INTROSPECTION_FIELD.name
+        name == TYPE_NAME_INTROSPECTION_FIELD.name
+        and _is_composite_type(parent_type)
     ):
         return TYPE_NAME_INTROSPECTION_FIELD
 
-    if isinstance(parent_type, (ObjectType, InterfaceType)):
+    if _is_field_container(parent_type):
         return parent_type.field_map.get(name, None)
 
     return None
@@ -91,8 +158,13 @@ class ValidationVisitor(DispatchingVisitor):
         type_info (TypeInfoVisitor): Type information collector provided by
             :func:`~py_gql.validation.validate`.
         errors (List[ValidationError]): Collected errors.
+        requires_type_info (bool): Class level flag. Set this to ``False`` on
+            subclasses which never read :attr:`type_info` so that it can be
+            skipped when none of the validators need it.
     """
 
+    requires_type_info = True
+
     def __init__(self, schema: Schema, type_info: "TypeInfoVisitor"):
         super(ValidationVisitor, self).__init__()
         self.schema = schema
@@ -233,11 +305,17 @@ class TypeInfoVisitor(DispatchingVisitor):
 
     __slots__ = (
         "_schema",
-        "_type_stack",
-        "_input_type_stack",
-        "_parent_type_stack",
-        "_field_stack",
-        "_input_value_def_stack",
+        "_frames",
+        "_type",
+        "_parent_type",
+        "_input_type",
+        "_parent_input_type",
+        "_field",
+        "_input_value_def",
+        "_field_defs",
+        "_input_value_maps",
+        "_operation_types",
+        "_literal_types",
         "directive",
         "argument",
         "enum_value",
@@ -246,11 +324,36 @@ class TypeInfoVisitor(DispatchingVisitor):
     def __init__(self, schema):
         self._schema = schema
 
-        self._type_stack = []  # type: OptList[GraphQLCompositeType]
-        self._parent_type_stack = []  # type: OptList[GraphQLCompositeType]
-        self._input_type_stack = []  # type: OptList[GraphQLType]
-        self._field_stack = []  # type: OptList[Field]
-        self._input_value_def_stack = []  # type: OptList[InputValue]
+        # The current state is stored as plain attributes as they are read
+        # multiple times per node by most validation rules. Entering a node
+        # which modifies it pushes the previous state as a single frame to be
+        # restored when leaving the node.
+        self._frames = []  # type: List[_Frame]
+        self._type = None  # type: Optional[GraphQLCompositeType]
+        self._parent_type = None  # type: Optional[GraphQLCompositeType]
+        self._input_type = None  # type: Optional[GraphQLType]
+        self._parent_input_type = None  # type: Optional[InputObjectType]
+        self._field = None  # type: Optional[Field]
+        self._input_value_def = None  # type: Optional[InputValue]
+        # Documents tend to select the same fields on the same types multiple
+        # times (e.g. on list items, through fragments, etc.).
+        self._field_defs = (
+            {}
+        )  # type: Dict[Tuple[GraphQLCompositeType, str], Optional[Field]]
+        # Keyed by id() of fields, directives and input object types which
+        # are kept alive by the schema.
+        self._input_value_maps = {}  # type: Dict[int, Mapping[str, InputValue]]
+        self._operation_types = {
+            operation: type_ if isinstance(type_, ObjectType) else None
+            for operation, type_ in (
+                ("query", schema.query_type),
+                ("mutation", schema.mutation_type),
+                ("subscription", schema.subscription_type),
+            )
+        }  # type: Dict[str, Optional[ObjectType]]
+        # The schema caches type literals per node, however the same literals
+        # tend to be repeated across a document.
+        self._literal_types = {}  # type: Dict[str, Optional[GraphQLType]]
 
         self.directive = None  # type: Optional[Directive]
         self.argument = None  # type: Optional[Argument]
@@ -258,70 +361,130 @@ class TypeInfoVisitor(DispatchingVisitor):
 
     @property
     def type(self) -> Optional[GraphQLCompositeType]:
-        return _peek(self._type_stack)
+        return self._type
 
     @property
     def parent_type(self) -> Optional[GraphQLCompositeType]:
-        return _peek(self._parent_type_stack, 1)
+        return self._parent_type
 
     @property
     def input_type(self) -> Optional[GraphQLType]:
-        return _peek(self._input_type_stack, 1)
+        return self._input_type
 
     @property
     def parent_input_type(self) -> Optional[InputObjectType]:
-        t = _peek(self._input_type_stack, 2)
-        return t if isinstance(t, InputObjectType) else None
+        return self._parent_input_type
 
     @property
     def field(self) -> Optional[Field]:
-        return _peek(self._field_stack)
+        return self._field
 
     @property
     def input_value_def(self) -> Optional[InputValue]:
-        return _peek(self._input_value_def_stack)
+        return self._input_value_def
 
     def _get_field_def(self, node):
-        parent_type = self.parent_type
-        return (
-            _get_field_def(self._schema, parent_type, node)
-            if parent_type
-            else None
-        )
+        parent_type = self._parent_type
+        if not parent_type:
+            return None
+
+        key = (parent_type, node.name.value)
+        try:
+            return self._field_defs[key]
+        except KeyError:
+            field_def = self._field_defs[key] = _get_field_def(
+                self._schema, parent_type, node
+            )
+            return field_def
+
+    def _input_value_map(self, owner):
+        # Field.argument_map and InputObjectType.field_map are rebuilt on
+        # every access.
+        key = id(owner)
+        try:
+            return self._input_value_maps[key]
+        except KeyError:
+            value_map = self._input_value_maps[key] = (
+                owner.field_map
+                if isinstance(owner, InputObjectType)
+                else owner.argument_map
+            )
+            return value_map
 
     def _type_from_ast(self, type_node):
+        key = _type_literal_key(type_node)
         try:
-            return self._schema.get_type_from_literal(type_node)
-        except UnknownType:
-            return None
+            return self._literal_types[key]
+        except KeyError:
+            try:
+                type_ = self._schema.get_type_from_literal(type_node)
+            except UnknownType:
+                type_ = None
+            self._literal_types[key] = type_
+            return type_
+
+    def _push_frame(self):
+        self._frames.append(
+            (
+                self._type,
+                self._parent_type,
+                self._input_type,
+                self._parent_input_type,
+                self._field,
+                self._input_value_def,
+            )
+        )
+
+    def _pop_frame(self):
+        (
+            self._type,
+            self._parent_type,
+            self._input_type,
+            self._parent_input_type,
+            self._field,
+            self._input_value_def,
+        ) = self._frames.pop()
+
+    def _set_input_type(self, input_type):
+        parent = self._input_type
+        self._parent_input_type = (
+            parent if isinstance(parent, InputObjectType) else None
+        )
+        self._input_type = input_type
 
-    def _leave_input_value(self):
-        self._input_type_stack.pop()
-        self._input_value_def_stack.pop()
+    def _enter_input_value(self, input_value_def, input_type):
+        self._push_frame()
+        self._input_value_def = input_value_def
+        self._set_input_type(input_type)
 
     def enter_selection_set(self, node):
-        named_type = unwrap_type(self.type) if self.type else None
-        self._parent_type_stack.append(
-            named_type if isinstance(named_type, GraphQLCompositeType) else None
-        )
+        type_ = self._type
+        self._push_frame()
+        if type_ is None:
+            self._parent_type = None
+        else:
+            named_type = _unwrap(type_)
+            self._parent_type = (
+                named_type if _is_composite_type(named_type) else None
+            )
         return node
 
     def leave_selection_set(self, _node):
-        self._parent_type_stack.pop()
+        self._pop_frame()
 
     def enter_field(self, node):
         field_def = self._get_field_def(node)
-        self._field_stack.append(field_def)
-        self._type_stack.append(
+        self._push_frame()
+        self._field = field_def
+        self._type = (
             field_def.type
-            if field_def and is_output_type(field_def.type)
+            if field_def and _is_output_type(field_def.type)
             else None
         )
         return node
 
     def leave_field(self, _node):
-        self._type_stack.pop()
-        self._field_stack.pop()
+        self._pop_frame()
 
     def enter_directive(self, node):
         self.directive = self._schema.directives.get(node.name.value)
@@ -331,105 +494,93 @@ class TypeInfoVisitor(DispatchingVisitor):
         self.directive = None
 
     def enter_operation_definition(self, node):
-        type_ = {
-            "query": self._schema.query_type,
-            "mutation": self._schema.mutation_type,
-            "subscription": self._schema.subscription_type,
-        }.get(node.operation, None)
-        self._type_stack.append(
-            type_ if isinstance(type_, ObjectType) else None
-        )
+        self._push_frame()
+        self._type = self._operation_types.get(node.operation)
         return node
 
     def leave_operation_definition(self, _node):
-        self._type_stack.pop()
+        self._pop_frame()
 
     def enter_fragment_definition(self, node):
         type_ = self._type_from_ast(node.type_condition)
-        self._type_stack.append(type_ if is_output_type(type_) else None)
+        self._push_frame()
+        self._type = type_ if _is_output_type(type_) else None
         return node
 
     def leave_fragment_definition(self, _node):
-        self._type_stack.pop()
+        self._pop_frame()
 
     def enter_inline_fragment(self, node):
+        self._push_frame()
         if node.type_condition:
             type_ = self._type_from_ast(node.type_condition)
-            self._type_stack.append(type_ if is_output_type(type_) else None)
-        else:
-            self._type_stack.append(
-                self.type if self.type and is_output_type(self.type) else None
-            )
+            self._type = type_ if _is_output_type(type_) else None
+        # Otherwise the current type carries over and has already been checked
+        # when it was entered.
         return node
 
     def leave_inline_fragment(self, _node):
-        self._type_stack.pop()
+        self._pop_frame()
 
     def enter_variable_definition(self, node):
         type_ = self._type_from_ast(node.type)
-        self._input_type_stack.append(type_ if is_input_type(type_) else None)
+        self._push_frame()
+        self._set_input_type(type_ if _is_input_type(type_) else None)
         return node
 
     def leave_variable_definition(self, _node):
-        self._input_type_stack.pop()
+        self._pop_frame()
 
     def enter_argument(self, node):
-        ctx = self.directive or self.field
+        ctx = self.directive or self._field
         if ctx:
-            name = node.name.value
-            self.argument = find_one(ctx.arguments, lambda a: a.name == name)
-            self._input_value_def_stack.append(self.argument)
-            self._input_type_stack.append(
+            self.argument = self._input_value_map(ctx).get(node.name.value)
+            self._enter_input_value(
+                self.argument,
                 self.argument.type
-                if self.argument and is_input_type(self.argument.type)
-                else None
+                if self.argument and _is_input_type(self.argument.type)
+                else None,
             )
         else:
             self.argument = None
-            self._input_type_stack.append(None)
-            self._input_value_def_stack.append(None)
+            self._enter_input_value(None, None)
         return node
 
     def leave_argument(self, _node):
         self.argument = None
-        self._leave_input_value()
+        self._pop_frame()
 
     def enter_list_value(self, node):
-
-        item_type = unwrap_type(self.input_type) if self.input_type else None
-
-        self._input_type_stack.append(
-            item_type if item_type and is_input_type(item_type) else None
-        )
+        item_type = _unwrap(self._input_type)
         # List positions never have a default value.
-        self._input_value_def_stack.append(None)
+        self._enter_input_value(
+            None, item_type if _is_input_type(item_type) else None
+        )
         return node
 
     def leave_list_value(self, _node):
-        self._leave_input_value()
+        self._pop_frame()
 
     def enter_object_field(self, node):
-        object_type = unwrap_type(self.input_type) if self.input_type else None
-        if isinstance(object_type, InputObjectType):
-            name = node.name.value
-            field_def = find_one(object_type.fields, lambda f: f.name == name)
-            self._input_value_def_stack.append(field_def)
-            self._input_type_stack.append(
+        object_type = _unwrap(self._input_type)
+        if _is_input_object_type(object_type):
+            field_def = self._input_value_map(object_type).get(node.name.value)
+            self._enter_input_value(
+                field_def,
                 field_def.type
-                if field_def and is_input_type(field_def.type)
-                else None
+                if field_def and _is_input_type(field_def.type)
+                else None,
             )
         else:
-            self._input_type_stack.append(None)
-            self._input_value_def_stack.append(None)
+            self._enter_input_value(None, None)
         return node
 
     def leave_object_field(self, _node):
-        self._leave_input_value()
+        self._pop_frame()
 
     def enter_enum_value(self, node):
-        enum = unwrap_type(self.input_type) if self.input_type else None
-        if isinstance(enum, EnumType):
+        enum = _unwrap(self._input_type)
+        if _is_enum_type(enum):
             try:
                 self.enum_value = enum.get_value(node.value)
             except UnknownEnumValue:
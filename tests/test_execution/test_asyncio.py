@@ -4,13 +4,14 @@ Execution tests specific to AsyncIORuntime().
 """
 
 import asyncio
+import threading
 from typing import Any, Awaitable, cast
 
 import pytest
 
 from py_gql import build_schema
 from py_gql.exc import ResolverError
-from py_gql.execution.runtime import AsyncIORuntime
+from py_gql.execution.runtime import AsyncIORuntime, sync_only
 
 from ._test_utils import assert_execution
 
@@ -228,3 +229,21 @@ async def test_AsyncIORuntime_map_value_async_caught(raiser):
         )
         == 42
     )
+
+
+@pytest.mark.asyncio
+async def test_AsyncIORuntime_sync_only_resolvers_are_not_offloaded():
+    threads = []
+
+    @sync_only
+    def resolve(*_: Any) -> int:
+        threads.append(threading.get_ident())
+        return 42
+
+    sync_schema = build_schema("type Query { a: Int! }")
+    sync_schema.register_resolver("Query", "a", resolve)
+
+    await assert_execution(
+        sync_schema, "{ a }", expected_data={"a": 42}, runtime=AsyncIORuntime()
+    )
+    assert threads == [threading.get_ident()]
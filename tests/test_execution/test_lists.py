@@ -6,6 +6,7 @@ Execution tests related to list types handling and resolution.
 import pytest
 
 from py_gql._utils import deduplicate, lazy
+from py_gql.execution import wrappers
 from py_gql.schema import (
     Field,
     Int,
@@ -225,3 +226,35 @@ async def test_nullable_list_of_non_nullable_items_fail(
         expected_errors=[expected_err],
         assert_execution=assert_execution,
     )
+
+
+async def test_list_items_subfields_are_collected_once(
+    mocker, assert_execution
+):
+    item_type = ObjectType("Item", [Field("a", Int), Field("b", String)])
+    schema = Schema(
+        ObjectType(
+            "Query",
+            [
+                Field(
+                    "items",
+                    ListType(item_type),
+                    resolver=lambda *_: [{"a": i, "b": str(i)} for i in range(5)],
+                )
+            ],
+        )
+    )
+
+    collect_fields = mocker.spy(wrappers.ResolutionContext, "collect_fields")
+
+    await assert_execution(
+        schema,
+        "{ items { a b } }",
+        expected_data={
+            "items": [{"a": i, "b": str(i)} for i in range(5)],
+        },
+    )
+
+    # Once for the root selection set and once for all list items, the
+    # sub-selections being memoized per type and field nodes.
+    assert collect_fields.call_count == 2
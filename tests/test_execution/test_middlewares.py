@@ -9,6 +9,7 @@ import pytest
 from py_gql import graphql, graphql_blocking
 from py_gql._string_utils import stringify_path
 from py_gql.exc import ResolverError
+from py_gql.execution import field_middleware
 
 from ._test_utils import assert_sync_execution
 
@@ -182,3 +183,52 @@ def test_middlewares_chain(starwars_schema):
     )
 
     assert {("hero",): 3, ("hero", "id"): 3} == context
+
+
+def test_invalid_middleware_raises_type_error(starwars_schema):
+    with pytest.raises(TypeError) as exc_info:
+        graphql_blocking(
+            starwars_schema,
+            "{ hero { id } }",
+            middlewares=[None],  # type: ignore
+        )
+    assert str(exc_info.value) == "Middleware should be a callable"
+
+
+def test_field_middleware_only_wraps_matching_fields(starwars_schema):
+    log = []  # type: List[str]
+    checked = collections.defaultdict(int)  # type: ignore
+
+    def on_name(parent_type, field_definition):
+        checked[(parent_type.name, field_definition.name)] += 1
+        return field_definition.name == "name"
+
+    @field_middleware(on_name)
+    def log_names(next_, root, ctx, info, **args):
+        log.append(stringify_path(info.path))
+        return next_(root, ctx, info, **args)
+
+    def add_to_chain(next_, root, ctx, info, **args):
+        ctx[tuple(info.path)] += 1
+        return next_(root, ctx, info, **args)
+
+    context = collections.defaultdict(int)  # type: ignore
+
+    result = graphql_blocking(
+        starwars_schema,
+        HERO_QUERY,
+        context=context,
+        middlewares=[log_names, add_to_chain],
+    )
+
+    assert not result.errors
+    assert log == [
+        "hero.name",
+        "hero.friends[0].name",
+        "hero.friends[1].name",
+        "hero.friends[2].name",
+    ]
+    # Unrestricted middlewares still apply to all fields.
+    assert len(context) == 7
+    # Predicates are evaluated once per field.
+    assert set(checked.values()) == {1}
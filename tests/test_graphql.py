@@ -7,11 +7,18 @@ import asyncio
 
 import pytest
 
-from py_gql._graphql import graphql, graphql_blocking, process_graphql_query
+from py_gql._graphql import (
+    compile_query,
+    graphql,
+    graphql_blocking,
+    process_graphql_query,
+)
 from py_gql.exc import ResolverError, SchemaError
+from py_gql.execution import wrappers
 from py_gql.execution.runtime import ThreadPoolRuntime
 from py_gql.schema import Schema, String
 from py_gql.sdl import build_schema
+from py_gql.tracers import TimingTracer
 
 
 async def _execute_query_blocking(*args, **kwargs):
@@ -28,9 +35,21 @@ async def _execute_query_threaded(*args, **kwargs):
     ).result()
 
 
+async def _execute_query_compiled(schema, document, **kwargs):
+    compiled = compile_query(
+        schema, document, operation_name=kwargs.pop("operation_name", None)
+    )
+    return compiled.execute(**kwargs)
+
+
 _with_execution_strategies = pytest.mark.parametrize(
     "execute_query",
-    [_execute_query_blocking, _execute_query_async, _execute_query_threaded],
+    [
+        _execute_query_blocking,
+        _execute_query_async,
+        _execute_query_threaded,
+        _execute_query_compiled,
+    ],
 )
 
 
@@ -355,3 +374,120 @@ async def test_graphql_with_async_resolvers():
             }
         ],
     } == result.response()
+
+
+def test_compiled_query_can_be_executed_multiple_times(starwars_schema):
+    compiled = compile_query(
+        starwars_schema,
+        """
+        query ($id: String!) {
+            human(id: $id) {
+                name
+            }
+        }
+        """,
+    )
+
+    assert compiled
+    assert compiled.execute(variables={"id": "1000"}).response() == {
+        "data": {"human": {"name": "Luke Skywalker"}}
+    }
+    assert compiled.execute(variables={"id": "1002"}).response() == {
+        "data": {"human": {"name": "Han Solo"}}
+    }
+
+
+def test_compiled_query_without_variables_shares_field_collection(
+    starwars_schema, mocker
+):
+    collect_fields = mocker.spy(wrappers, "collect_fields")
+    compiled = compile_query(starwars_schema, "{ hero { name } }")
+
+    first = compiled.execute()
+    assert collect_fields.call_count == 2
+
+    second = compiled.execute()
+    assert collect_fields.call_count == 2
+
+    assert first.response() == second.response() == {
+        "data": {"hero": {"name": "R2-D2"}}
+    }
+
+
+def test_compiled_query_with_variables_shares_field_collection(
+    starwars_schema, mocker
+):
+    collect_fields = mocker.spy(wrappers, "collect_fields")
+    compiled = compile_query(
+        starwars_schema,
+        """
+        query ($id: String!) {
+            human(id: $id) { ...F }
+        }
+
+        fragment F on Human { name }
+        """,
+    )
+    assert compiled.execute(variables={"id": "1000"}).response() == {
+        "data": {"human": {"name": "Luke Skywalker"}}
+    }
+    assert collect_fields.call_count == 2
+
+    assert compiled.execute(variables={"id": "1002"}).response() == {
+        "data": {"human": {"name": "Han Solo"}}
+    }
+    assert collect_fields.call_count == 2
+
+
+def test_compiled_query_with_variable_conditions_does_not_share_fields(
+    starwars_schema, mocker
+):
+    collect_fields = mocker.spy(wrappers, "collect_fields")
+    compiled = compile_query(
+        starwars_schema,
+        """
+        query ($withName: Boolean!) {
+            hero {
+                id
+                ... on Droid { name @include(if: $withName) }
+            }
+        }
+        """,
+    )
+    assert compiled.execute(variables={"withName": True}).response() == {
+        "data": {"hero": {"id": "2001", "name": "R2-D2"}}
+    }
+    assert collect_fields.call_count == 2
+
+    assert compiled.execute(variables={"withName": False}).response() == {
+        "data": {"hero": {"id": "2001"}}
+    }
+    assert collect_fields.call_count == 4
+
+
+def test_compiled_query_instrumentation(starwars_schema):
+    tracer = TimingTracer()
+    compiled = compile_query(
+        starwars_schema, "{ hero { name } }", instrumentation=tracer
+    )
+    assert tracer.parse_start is not None and tracer.parse_end is not None
+    assert tracer.validation_start is not None
+    assert tracer.validation_end is not None
+    assert tracer.start is None
+
+    compiled.execute(instrumentation=tracer)
+    assert tracer.start is not None and tracer.end is not None
+    assert tracer.query_start is not None and tracer.query_end is not None
+
+
+def test_compiled_query_reports_errors_on_execution(starwars_schema):
+    compiled = compile_query(starwars_schema, "{ hero { foo } }")
+    assert not compiled
+    assert compiled.execute().response() == {
+        "errors": [
+            {
+                "message": 'Cannot query field "foo" on type "Character".',
+                "locations": [{"line": 1, "column": 10}],
+            }
+        ]
+    }
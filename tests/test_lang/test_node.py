@@ -5,6 +5,7 @@ import copy
 import pytest
 
 from py_gql.lang import ast as _ast, parse
+from py_gql.lang.visitor import ASTVisitor
 
 
 @pytest.mark.parametrize(
@@ -172,3 +173,123 @@ def test_copy_does_not_raise(fixture_file, fixture_name):
     doc = parse(fixture_file(fixture_name), allow_type_system=True)
     assert copy.copy(doc) == doc
     assert copy.deepcopy(doc) == doc
+
+
+def test_names_are_interned():
+    first = parse("{ foo: bar }").definitions[0]
+    second = parse("{ bar { foo } }").definitions[0]
+    assert isinstance(first, _ast.OperationDefinition)
+    assert isinstance(second, _ast.OperationDefinition)
+
+    field_1 = first.selection_set.selections[0]
+    field_2 = second.selection_set.selections[0]
+    assert isinstance(field_1, _ast.Field)
+    assert isinstance(field_2, _ast.Field) and field_2.selection_set
+
+    nested = field_2.selection_set.selections[0]
+    assert isinstance(nested, _ast.Field)
+
+    assert field_1.name.value is field_2.name.value
+    assert field_1.response_name is nested.name.value
+
+
+def test_deepcopy_does_not_share_children():
+    doc = parse("{ foo { bar } }")
+    doc_copy = copy.deepcopy(doc)
+    assert doc_copy == doc
+    assert doc_copy.definitions is not doc.definitions
+    assert doc_copy.definitions[0] is not doc.definitions[0]
+
+
+def test_copy_shares_children():
+    doc = parse("{ foo { bar } }")
+    doc_copy = copy.copy(doc)
+    assert doc_copy is not doc
+    assert doc_copy.definitions is doc.definitions
+
+
+@pytest.mark.parametrize(
+    "fixture_name", ["kitchen-sink.graphql", "schema-kitchen-sink.graphql"],
+)
+def test_nodes_do_not_have_instance_dict(fixture_file, fixture_name):
+    class Collector(ASTVisitor):
+        def __init__(self):
+            self.nodes = []
+
+        def enter(self, node):
+            self.nodes.append(node)
+            return node
+
+    collector = Collector()
+    collector.visit(parse(fixture_file(fixture_name), allow_type_system=True))
+
+    assert collector.nodes
+    for node in collector.nodes:
+        assert not hasattr(node, "__dict__"), type(node)
+
+
+def test_document_definitions_by_kind():
+    doc = parse(
+        """
+        query A { ...F }
+        fragment F on Query { foo }
+        query B { bar }
+        """
+    )
+    a, f, b = doc.definitions
+    assert doc.operations == [a, b]
+    assert doc.fragments == {"F": f}
+
+
+def test_document_definitions_by_kind_tracks_modifications():
+    doc = parse("query A { ...F } fragment F on Query { foo }")
+    assert len(doc.operations) == 1
+    assert set(doc.fragments) == {"F"}
+
+    doc.definitions.extend(parse("query B { bar }").definitions)
+    assert len(doc.operations) == 2
+
+    doc.definitions[1] = parse("fragment G on Query { foo }").definitions[0]
+    assert set(doc.fragments) == {"G"}
+
+
+def test_document_fragments_are_read_only():
+    doc = parse("query A { ...F } fragment F on Query { foo }")
+    with pytest.raises(TypeError):
+        doc.fragments["G"] = doc.definitions[1]  # type: ignore
+    assert set(doc.fragments) == {"F"}
+
+
+def test_document_cache_is_not_part_of_equality():
+    doc = parse("query A { ...F } fragment F on Query { foo }")
+    other = parse("query A { ...F } fragment F on Query { foo }")
+    assert doc.fragments
+    assert doc == other
+    assert "_definitions_index" not in doc.to_dict()
+
+
+def test_nodes_hash_by_identity():
+    lhs = _ast.Name("foo")
+    rhs = _ast.Name("foo")
+    assert lhs == rhs
+    assert len({lhs, rhs}) == 2
+    assert hash(lhs) == hash(lhs)
+
+
+def test_custom_node_subclass():
+    class Custom(_ast.Node):
+        __slots__ = ("source", "loc", "value")
+
+        def __init__(self, value, source=None, loc=None):
+            self.value = value
+            self.source = source
+            self.loc = loc
+
+    assert Custom("foo", "a") == Custom("foo", "b")
+    assert Custom("foo") != Custom("bar")
+    assert Custom("foo").to_dict() == {
+        "__kind__": "Custom",
+        "loc": None,
+        "value": "foo",
+    }
+    assert copy.copy(Custom("foo", loc=(0, 1))).loc == (0, 1)
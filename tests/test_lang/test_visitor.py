@@ -605,6 +605,31 @@ def test_it_processes_github_schema_sink_without_crashing(fixture_file):
     visitor.visit(parse(sdl, no_location=True, allow_type_system=True))
 
 
+def test_dispatching_visitor_subclasses_use_their_own_handlers():
+    class Parent(DispatchingVisitor):
+        def __init__(self):
+            self.visited = []
+
+        def enter_field(self, field):
+            self.visited.append(("parent", field.name.value))
+            return field
+
+    class Child(Parent):
+        def enter_field(self, field):
+            self.visited.append(("child", field.name.value))
+            return field
+
+    doc = parse("{ foo }")
+    parent, child, other_parent = Parent(), Child(), Parent()
+    parent.visit(doc)
+    child.visit(doc)
+    other_parent.visit(doc)
+
+    assert parent.visited == [("parent", "foo")]
+    assert child.visited == [("child", "foo")]
+    assert other_parent.visited == [("parent", "foo")]
+
+
 def test_node_removal():
     class Visitor(DispatchingVisitor):
         def enter_field(self, field):
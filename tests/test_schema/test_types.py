@@ -19,10 +19,12 @@ from py_gql.schema import (
     UUID,
     Boolean,
     EnumType,
+    Field,
     Float,
     Int,
     ListType,
     NonNullType,
+    ObjectType,
     RegexType,
     String,
 )
@@ -36,6 +38,20 @@ def test_as_non_null():
     assert UUID.as_non_null() == NonNullType(UUID)
 
 
+def test_field_map_is_updated_when_setting_fields():
+    t = ObjectType("Object", [Field("foo", String)])
+    assert list(t.field_map) == ["foo"]
+    t.fields = [Field("bar", String)]
+    assert list(t.field_map) == ["bar"]
+
+
+def test_field_map_is_read_only():
+    t = ObjectType("Object", [Field("foo", String)])
+    with pytest.raises(TypeError):
+        t.field_map["bar"] = Field("bar", String)  # type: ignore
+    assert list(t.field_map) == ["foo"]
+
+
 def test_EnumType_rejects_duplicate_names():
     with pytest.raises(ValueError):
         EnumType("Enum", [("SOME_NAME", 1), ("SOME_NAME", 2)])
@@ -3,7 +3,8 @@
 Test schema validation.
 """
 
-from typing import Any, List
+import functools
+from typing import Any, Tuple
 
 import pytest
 
@@ -52,14 +53,14 @@ SomeInputObject = InputObjectType(
 
 
 def _type_modifiers(t):
-    return [t, ListType(t), NonNullType(t), NonNullType(ListType(t))]
+    list_type = ListType(t)
+    return (t, list_type, NonNullType(t), NonNullType(list_type))
 
 
 def _with_modifiers(types):
-    out = []  # type: List[GraphQLType]
-    for t in types:
-        out.extend(_type_modifiers(t))
-    return out
+    return tuple(
+        modified for t in types for modified in _type_modifiers(t)
+    )  # type: Tuple[GraphQLType, ...]
 
 
 output_types = _with_modifiers(
@@ -73,6 +74,19 @@ input_types = _with_modifiers([String, SomeScalar, SomeEnum, SomeInputObject])
 not_input_types = _with_modifiers([SomeObject, SomeUnion, SomeInterface])
 
 
+def _params(types):
+    return tuple(pytest.param(t, id="type = %s" % t) for t in types)
+
+
+output_type_params = _params(output_types)
+not_output_type_params = _params(not_output_types + (None,))
+input_type_params = _params(input_types)
+not_input_type_params = _params(not_input_types + (None,))
+
+
+# Parametrized tests build the same schemas over and over, these are never
+# modified by the tests so they can be shared.
+@functools.lru_cache(maxsize=None)
 def _single_type_schema(type_: Any, fieldname: str = "f") -> Schema:
     return Schema(ObjectType("Query", [Field(fieldname, type_)]), types=[type_])
 
@@ -98,6 +112,55 @@ def test_query_and_subscription_types_are_object_types():
     schema.validate()
 
 
+def test_validate_caches_result(mocker):
+    validate = mocker.patch(
+        "py_gql.schema.schema.validate_schema", return_value=True
+    )
+    schema = Schema(ObjectType("Query", [Field("test", String)]))
+    schema.validate()
+    schema.validate()
+    assert validate.call_count == 1
+
+
+def test_validate_caches_error(mocker):
+    validate = mocker.patch(
+        "py_gql.schema.schema.validate_schema", wraps=validate_schema
+    )
+    schema = Schema(String)  # type: ignore
+
+    with pytest.raises(SchemaError) as first:
+        schema.validate()
+
+    with pytest.raises(SchemaError) as second:
+        schema.validate()
+
+    assert first.value is second.value
+    assert validate.call_count == 1
+
+
+def test_validate_cached_error_traceback_does_not_grow():
+    schema = Schema(String)  # type: ignore
+
+    def _traceback_length():
+        with pytest.raises(SchemaError) as exc_info:
+            schema.validate()
+        return len(exc_info.traceback)
+
+    _traceback_length()
+    assert _traceback_length() == _traceback_length()
+
+
+def test_validate_is_reset_by_registering_resolvers(mocker):
+    validate = mocker.patch(
+        "py_gql.schema.schema.validate_schema", return_value=True
+    )
+    schema = Schema(ObjectType("Query", [Field("test", String)]))
+    schema.validate()
+    schema.register_resolver("Query", "test", lambda *_: "test")
+    schema.validate()
+    assert validate.call_count == 2
+
+
 def test_reject_non_object_query_type():
     schema = Schema(String)  # type: ignore
 
@@ -308,15 +371,13 @@ def test_reject_enum_value_with_incorrect_name():
     assert 'Invalid name "#value"' in str(exc_info.value)
 
 
-@pytest.mark.parametrize("type_", output_types, ids=lambda t: "type = %s" % t)
+@pytest.mark.parametrize("type_", output_type_params)
 def test_accept_output_type_as_object_fields(type_):
     schema = _single_type_schema(type_)
     schema.validate()
 
 
-@pytest.mark.parametrize(
-    "type_", not_output_types + [None], ids=lambda t: "type = %s" % t
-)
+@pytest.mark.parametrize("type_", not_output_type_params)
 def test_reject_non_output_type_as_object_fields(type_):
     schema = _single_type_schema(type_)
     with pytest.raises(SchemaError) as exc_info:
@@ -344,16 +405,14 @@ def test_reject_object_implementing_same_interface_twice():
     )
 
 
-@pytest.mark.parametrize("type_", output_types, ids=lambda t: "type = %s" % t)
+@pytest.mark.parametrize("type_", output_type_params)
 def test_accept_interface_fields_with_output_type(type_):
     iface = InterfaceType("GoodInterface", [Field("f", type_)])
     schema = _single_type_schema(iface)
     schema.validate()
 
 
-@pytest.mark.parametrize(
-    "type_", not_output_types + [None], ids=lambda t: "type = %s" % t
-)
+@pytest.mark.parametrize("type_", not_output_type_params)
 def test_reject_interface_fields_with_non_output_type(type_):
     iface = InterfaceType("BadInterface", [Field("f", type_)])
     schema = _single_type_schema(iface)
@@ -377,7 +436,7 @@ def test_reject_interface_with_no_field():
     )
 
 
-@pytest.mark.parametrize("type_", input_types, ids=lambda t: "type = %s" % t)
+@pytest.mark.parametrize("type_", input_type_params)
 def test_accept_argument_with_input_type(type_):
     schema = _single_type_schema(
         ObjectType(
@@ -387,9 +446,7 @@ def test_accept_argument_with_input_type(type_):
     schema.validate()
 
 
-@pytest.mark.parametrize(
-    "type_", not_input_types + [None], ids=lambda t: "type = %s" % t
-)
+@pytest.mark.parametrize("type_", not_input_type_params)
 def test_reject_argument_with_non_input_type(type_):
     schema = _single_type_schema(
         ObjectType(
@@ -405,7 +462,7 @@ def test_reject_argument_with_non_input_type(type_):
     ) in str(exc_info.value)
 
 
-@pytest.mark.parametrize("type_", input_types, ids=lambda t: "type = %s" % t)
+@pytest.mark.parametrize("type_", input_type_params)
 def test_accept_input_object_with_input_type(type_):
     schema = _single_type_schema(
         ObjectType(
@@ -429,9 +486,7 @@ def test_accept_input_object_with_input_type(type_):
     schema.validate()
 
 
-@pytest.mark.parametrize(
-    "type_", not_input_types + [None], ids=lambda t: "type = %s" % t
-)
+@pytest.mark.parametrize("type_", not_input_type_params)
 def test_reject_input_object_with_non_input_type(type_):
     schema = _single_type_schema(
         ObjectType(
@@ -5,7 +5,7 @@ import pytest
 from py_gql import graphql_blocking
 from py_gql._string_utils import dedent
 from py_gql.exc import SDLError
-from py_gql.lang import parse
+from py_gql.lang import ast as _ast, parse
 from py_gql.schema import SPECIFIED_DIRECTIVES, UUID
 from py_gql.sdl import build_schema
 
@@ -43,6 +43,11 @@ def test_accepts_strings():
     assert data == {"str": "123"}
 
 
+def test_rejects_invalid_document():
+    with pytest.raises(TypeError):
+        build_schema(42)  # type: ignore
+
+
 def test_simple_type():
     schema = """
     type Query {
@@ -849,5 +854,21 @@ def test_build_schema_ignores_extensions_if_specified():
     )
 
 
+def test_build_schema_supports_type_definition_subclasses():
+    class CustomObjectTypeDefinition(_ast.ObjectTypeDefinition):
+        __slots__ = ()
+
+    query_def = parse("type Query { str: String }", allow_type_system=True)
+    original = query_def.definitions[0]
+    assert isinstance(original, _ast.ObjectTypeDefinition)
+    query_def.definitions[0] = CustomObjectTypeDefinition(
+        name=original.name, fields=original.fields
+    )
+
+    schema = build_schema(query_def)
+    data, _ = graphql_blocking(schema, "{ str }", root={"str": "foo"})
+    assert data == {"str": "foo"}
+
+
 def test_build_github_schema(fixture_file):
     build_schema(fixture_file("github-schema.graphql")).validate()
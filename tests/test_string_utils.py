@@ -62,6 +62,27 @@ def test_highlight_location_2():
     )
 
 
+def test_highlight_location_crlf():
+    body = "type Foo {\r\n  a: Int\r\n  b: Str\r\n}\r\n"
+    assert highlight_location(body, 25) == (
+        """(3:4):
+  1:type Foo {
+  2:  a: Int
+  3:  b: Str
+       ^
+  4:}
+  5:
+"""
+    )
+
+
+def test_highlight_location_pads_line_numbers():
+    body = "\n".join("line %d" % i for i in range(1, 121))
+    output = highlight_location(body, body.index("line 8\n"), delta=100)
+    assert "  008:line 8\n" in output
+    assert "  108:line 108\n" in output
+
+
 @pytest.mark.parametrize(
     "value,expected",
     [
@@ -132,6 +153,11 @@ def test_highlight_location_2():
             ),
             id="Does not alter trailing spaces",
         ),
+        pytest.param(
+            "\n".join(["", "\t\tHello,", "\t\t  World!", "\t"]),
+            "\n".join(["Hello,", "  World!"]),
+            id="Handles tabs as indentation",
+        ),
     ],
 )
 def test_parse_block_string(value, expected):
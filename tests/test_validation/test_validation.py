@@ -3,6 +3,11 @@
 Test default validation.
 """
 
+from py_gql.lang import parse
+from py_gql.schema import Field, Int, ListType, ObjectType, Schema
+from py_gql.validation import ValidationVisitor
+from py_gql.validation.validate import default_validator
+
 from ._test_utils import assert_validation_result
 
 
@@ -161,3 +166,54 @@ def test_allows_object_fields_in_inline_fragments(starwars_schema):
         }
         """,
     )
+
+
+def _field_types_collector(requires_type_info):
+    class FieldTypesCollector(ValidationVisitor):
+        def enter_field(self, node):
+            self.add_error(str(self.type_info.type))
+
+    FieldTypesCollector.requires_type_info = requires_type_info
+    return FieldTypesCollector
+
+
+def test_subclassed_wrapping_types_are_unwrapped():
+    class CustomListType(ListType):
+        __slots__ = ()
+
+    item = ObjectType("Item", [Field("id", Int)])
+    schema = Schema(ObjectType("Query", [Field("items", CustomListType(item))]))
+
+    assert_validation_result(schema, "{ items { id } }")
+    assert_validation_result(
+        schema,
+        "{ items { foo } }",
+        ['Cannot query field "foo" on type "Item".'],
+    )
+
+
+def test_type_info_is_tracked_when_required(starwars_schema):
+    errors = default_validator(
+        starwars_schema,
+        parse("{ hero { name } }"),
+        validators=[_field_types_collector(True)],
+    )
+    assert [str(e) for e in errors] == ["Character", "String"]
+
+
+def test_type_info_is_not_tracked_when_not_required(starwars_schema):
+    errors = default_validator(
+        starwars_schema,
+        parse("{ hero { name } }"),
+        validators=[_field_types_collector(False)],
+    )
+    assert [str(e) for e in errors] == ["None", "None"]
+
+
+def test_no_rules_does_not_visit_the_document(starwars_schema, mocker):
+    visitor = mocker.patch("py_gql.validation.validate.ChainedVisitor")
+    errors = default_validator(
+        starwars_schema, parse("{ hero { name } }"), validators=[]
+    )
+    assert errors == []
+    assert not visitor.called